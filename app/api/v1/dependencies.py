@@ -7,7 +7,7 @@ from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBea
 from jose import JWTError
 from neo4j import Session
 
-from app.core.security import decode_token, hash_api_key, verify_api_key
+from app.core.security import decode_token, hash_api_key, hash_api_key_legacy
 from app.db.neo4j import get_session
 from app.db.repositories.user import User, UserRepository, UserRole
 
@@ -51,6 +51,18 @@ _bearer = HTTPBearer(auto_error=False)
 _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+def _user_from_api_key(repo: UserRepository, api_key: str) -> Optional[User]:
+    """Look up the owner of *api_key*, upgrading a legacy SHA-256 digest in place."""
+    user = repo.get_by_api_key_hash(hash_api_key(api_key))
+    if user is not None:
+        return user
+    user = repo.get_by_api_key_hash(hash_api_key_legacy(api_key))
+    if user is not None:
+        user.api_key_hash = hash_api_key(api_key)
+        repo.update(user)
+    return user
+
+
 def get_current_user(
     session: DbSession,
     bearer_creds: Annotated[
@@ -70,18 +82,15 @@ def get_current_user(
         # Also accept API keys via Bearer (lng_...)
         from app.core.security import API_KEY_PREFIX
         if token.startswith(API_KEY_PREFIX):
-            user = repo.get_by_api_key_hash(hash_api_key(token))
+            user = _user_from_api_key(repo, token)
             if user and user.is_active:
                 return user
         else:
             try:
                 payload = decode_token(token)
-                if payload.get("type") != "access":
+                if payload["type"] != "access":
                     raise JWTError("not an access token")
-                user_id = payload.get("sub")
-                if user_id is None:
-                    raise JWTError("missing sub")
-                user = repo.get_by_id(__import__("uuid").UUID(user_id))
+                user = repo.get_by_id(__import__("uuid").UUID(payload["sub"]))
                 if user and user.is_active:
                     return user
             except JWTError:
@@ -89,7 +98,7 @@ def get_current_user(
 
     # --- X-API-Key header ---
     if api_key_header is not None:
-        user = repo.get_by_api_key_hash(hash_api_key(api_key_header))
+        user = _user_from_api_key(repo, api_key_header)
         if user and user.is_active:
             return user
 
@@ -3,7 +3,7 @@
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.schema import ColumnLineageMap, Lineage, LineageType
 
@@ -17,12 +17,11 @@ class LineageCreate(BaseModel):
     description: Optional[str] = None
     extra_metadata: dict[str, Any] = Field(default_factory=dict)
 
-    @field_validator("target_object_id")
-    @classmethod
-    def source_and_target_must_differ(cls, v: UUID, info: Any) -> UUID:
-        if "source_object_id" in info.data and v == info.data["source_object_id"]:
+    @model_validator(mode="after")
+    def source_and_target_must_differ(self) -> "LineageCreate":
+        if self.source_object_id == self.target_object_id:
             raise ValueError("source_object_id and target_object_id must be different")
-        return v
+        return self
 
     def to_domain(self) -> Lineage:
         return Lineage(**self.model_dump())
@@ -81,11 +81,9 @@ def refresh_token(body: RefreshRequest, session: DbSession) -> TokenResponse:
     """Exchange a refresh token for a new access + refresh token pair."""
     try:
         payload = decode_token(body.refresh_token)
-        if payload.get("type") != "refresh":
+        if payload["type"] != "refresh":
             raise JWTError("not a refresh token")
-        user_id = payload.get("sub")
-        if not user_id:
-            raise JWTError("missing sub")
+        user_id = payload["sub"]
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
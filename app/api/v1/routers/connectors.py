@@ -143,8 +143,7 @@ def extract_postgresql(
     lin_repo = LineageRepository(session)
 
     src_repo.create(datasource)
-    for obj in objects:
-        obj_repo.create(obj)
+    obj_repo.bulk_upsert(objects)
 
     # Columns don't have a dedicated repo — store via DataObject extra_metadata is
     # too limiting. We use a lightweight Column node repo if it exists, else skip.
@@ -152,16 +151,20 @@ def extract_postgresql(
         from app.db.repositories.column import ColumnRepository
 
         col_repo = ColumnRepository(session)
-        for col in columns:
-            col_repo.create(col)
+        col_repo.bulk_upsert(columns)
     except (ImportError, Exception) as exc:
         logger.debug("Column persistence skipped: %s", exc)
 
-    for lin in lineage_list:
-        try:
-            lin_repo.create(lin)
-        except Exception as exc:
-            logger.warning("Skipping lineage edge %s: %s", lin.id, exc)
+    try:
+        lin_repo.bulk_upsert(lineage_list)
+    except Exception as exc:
+        # Fall back to per-edge writes so one bad edge doesn't drop the batch
+        logger.warning("Batched lineage write failed (%s); retrying per edge", exc)
+        for lin in lineage_list:
+            try:
+                lin_repo.create(lin)
+            except Exception as edge_exc:
+                logger.warning("Skipping lineage edge %s: %s", lin.id, edge_exc)
 
     slow_warning = None
     if duration > 5:
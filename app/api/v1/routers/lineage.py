@@ -1,9 +1,12 @@
 """REST endpoints for Lineage — /api/v1/lineage."""
 
+from collections.abc import Iterator
 from typing import Annotated, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.api.v1.dependencies import CurrentUser, DbSession, WriterUser
 from app.api.v1.models.lineage import (
@@ -15,6 +18,7 @@ from app.api.v1.models.lineage import (
     LineageUpdate,
 )
 from app.core.errors import NotFoundError
+from app.db.neo4j import get_driver
 from app.db.repositories.lineage import LineageRepository
 
 router = APIRouter(prefix="/lineage", tags=["lineage"])
@@ -48,6 +52,24 @@ def list_lineage(
     return LineageListResponse(items=items, count=len(items))
 
 
+def _export_lines() -> Iterator[bytes]:
+    # Owns its session: the request-scoped DbSession may already be closed by
+    # the time the response body is being streamed.
+    with get_driver().session() as session:
+        for lin in LineageRepository(session).iter_all():
+            yield orjson.dumps(lin.model_dump(mode="json")) + b"\n"
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_lineage(_: CurrentUser) -> StreamingResponse:
+    """Stream every Lineage record as newline-delimited JSON.
+
+    Records are encoded as they arrive from Neo4j, so memory stays flat and
+    the first bytes go out before the full result has been read.
+    """
+    return StreamingResponse(_export_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/{lineage_id}", response_model=LineageResponse)
 def get_lineage(lineage_id: UUID, session: DbSession, _: CurrentUser) -> LineageResponse:
     repo = LineageRepository(session)
@@ -82,20 +104,14 @@ def get_downstream(
     session: DbSession,
     _: CurrentUser,
     max_depth: Annotated[int, Query(ge=1, le=20, description="Max traversal depth")] = 10,
+    limit: Annotated[
+        Optional[int], Query(ge=1, le=1000, description="Max nodes to return")
+    ] = None,
+    offset: Annotated[int, Query(ge=0, description="Nodes to skip, in depth order")] = 0,
 ) -> ImpactResponse:
     repo = LineageRepository(session)
-    raw = repo.get_downstream(object_id, max_depth=max_depth)
-    nodes = [
-        ImpactNode(
-            id=UUID(r["props"]["id"]),
-            name=r["props"]["name"],
-            object_type=r["props"]["object_type"],
-            source_id=UUID(r["props"]["source_id"]),
-            depth=r["depth"],
-            lineage_id=r["lineage_id"],
-        )
-        for r in raw
-    ]
+    raw = repo.get_downstream(object_id, max_depth=max_depth, limit=limit, offset=offset)
+    nodes = [ImpactNode.model_validate(r) for r in raw]
     return ImpactResponse(object_id=object_id, direction="downstream", nodes=nodes)
 
 
@@ -105,18 +121,12 @@ def get_upstream(
     session: DbSession,
     _: CurrentUser,
     max_depth: Annotated[int, Query(ge=1, le=20, description="Max traversal depth")] = 10,
+    limit: Annotated[
+        Optional[int], Query(ge=1, le=1000, description="Max nodes to return")
+    ] = None,
+    offset: Annotated[int, Query(ge=0, description="Nodes to skip, in depth order")] = 0,
 ) -> ImpactResponse:
     repo = LineageRepository(session)
-    raw = repo.get_upstream(object_id, max_depth=max_depth)
-    nodes = [
-        ImpactNode(
-            id=UUID(r["props"]["id"]),
-            name=r["props"]["name"],
-            object_type=r["props"]["object_type"],
-            source_id=UUID(r["props"]["source_id"]),
-            depth=r["depth"],
-            lineage_id=r["lineage_id"],
-        )
-        for r in raw
-    ]
+    raw = repo.get_upstream(object_id, max_depth=max_depth, limit=limit, offset=offset)
+    nodes = [ImpactNode.model_validate(r) for r in raw]
     return ImpactResponse(object_id=object_id, direction="upstream", nodes=nodes)
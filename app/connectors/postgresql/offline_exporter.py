@@ -42,7 +42,8 @@ def export_to_folder(
         schema_filter: optional list of schema names to include.
 
     Returns:
-        Summary dict: {schemas, tables, views, functions, output_folder}.
+        Summary dict: {schemas, tables, views, functions, output_folder,
+        files, file_sizes} — file_sizes maps each file name to bytes written.
     """
     os.makedirs(output_folder, exist_ok=True)
 
@@ -98,10 +99,15 @@ def export_to_folder(
     finally:
         conn.close()
 
+    file_sizes: dict[str, int] = {}
+
     def _write(name: str, data: Any) -> None:
         path = os.path.join(output_folder, name)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        payload = json.dumps(data, indent=2, default=str).encode()
+        with open(path, "wb") as f:
+            f.write(payload)
+        # Recorded here so callers can report sizes without stat()ing files.
+        file_sizes[name] = len(payload)
         logger.info("Wrote %s", path)
 
     _write("tables.json", tables_out)
@@ -123,5 +129,6 @@ def export_to_folder(
             "view_definitions.json": os.path.join(output_folder, "view_definitions.json"),
             "functions.json": os.path.join(output_folder, "functions.json"),
         },
+        "file_sizes": file_sizes,
     }
     return summary
@@ -20,9 +20,16 @@ class Settings(BaseSettings):
     NEO4J_MAX_CONNECTION_LIFETIME_S: float = 3600.0
     NEO4J_CONNECTION_ACQUISITION_TIMEOUT_S: float = 60.0
     NEO4J_CONNECTION_TIMEOUT_S: float = 30.0
+    # How long a successful connectivity check is trusted before re-probing
+    NEO4J_HEALTH_CACHE_TTL_S: float = 2.0
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+    # Lifetime of cached impact traversals in Redis; 0 disables the cache
+    LINEAGE_CACHE_TTL_S: int = 60
+
+    # /health: how long a healthy response is reused before re-probing
+    HEALTH_CACHE_TTL_S: float = 1.0
 
     # PostgreSQL connector defaults
     PG_HOST: str = "localhost"
@@ -37,9 +44,15 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "change-me-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # bcrypt work factor (log2 rounds, 4–31). Keep >= 12 in production per
+    # OWASP; dev/test environments may lower it to 4 to speed up fixtures.
+    BCRYPT_ROUNDS: int = 12
     # Bootstrapped admin (created on first startup when no users exist)
     FIRST_ADMIN_EMAIL: str = "admin@lineage-tool.dev"
     FIRST_ADMIN_PASSWORD: str = "change-me-in-production"
+    # Optional precomputed bcrypt hash of the admin password.  When set it is
+    # stored as-is, so seeding an empty database costs no hashing at startup.
+    FIRST_ADMIN_PASSWORD_HASH: str | None = None
 
 
 settings = Settings()
@@ -2,12 +2,17 @@
 
 Design decisions
 ----------------
-- Passwords: bcrypt via passlib (slow by design, resistant to brute-force)
+- Passwords: bcrypt via passlib (slow by design, resistant to brute-force).
+  The work factor comes from settings.BCRYPT_ROUNDS — production should keep
+  the default of 12 or higher; test suites may drop it to 4.
 - Access tokens: short-lived JWT (default 30 min), signed with HS256
 - Refresh tokens: longer-lived JWT (default 7 days), same secret key
   but carries  {"type": "refresh"}  so it cannot be used as an access token
 - API keys: random 32-byte hex prefixed with "lng_" (format: lng_<64 hex chars>)
-  Stored as a SHA-256 hex digest so the plaintext is never persisted.
+  Stored as a BLAKE2b-128 hex digest so the plaintext is never persisted.
+  The key is 256 bits of CSPRNG output, so a fast 128-bit hash is as safe as
+  SHA-256 here; legacy 64-char SHA-256 digests are still accepted and are
+  re-hashed to BLAKE2b the next time the key is used.
   API keys are shown exactly once at generation time.
 
 Offline folder validation
@@ -35,9 +40,22 @@ from app.core.config import settings
 
 API_KEY_PREFIX = "lng_"
 
+_JWT_ALGORITHM = "HS256"
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+# Enforced by jose during decode: signature, expiry, and presence of exp/sub.
+# Audience is not used by this service.
+_JWT_DECODE_OPTIONS = {"require_exp": True, "require_sub": True, "verify_aud": False}
 
-def hash_password(plain: str) -> str:
-    return bcrypt.hashpw(plain.encode(), bcrypt.gensalt()).decode()
+
+def hash_password(plain: str, rounds: int | None = None) -> str:
+    salt = bcrypt.gensalt(rounds or settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(plain.encode(), salt).decode()
+
+
+def warmup_password_hashing() -> None:
+    """Exercise bcrypt once at minimum cost so the native extension is loaded
+    and paged in at startup rather than on the first login request."""
+    hash_password("warmup", rounds=4)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -64,7 +82,7 @@ def create_access_token(
         "type": "access",
         "exp": expire,
     }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm=_JWT_ALGORITHM)
 
 
 def create_refresh_token(subject: str) -> str:
@@ -77,12 +95,25 @@ def create_refresh_token(subject: str) -> str:
         "type": "refresh",
         "exp": expire,
     }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm=_JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> dict[str, Any]:
-    """Decode and verify a JWT.  Raises JWTError on any failure."""
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    """Decode and verify a JWT.  Raises JWTError on any failure.
+
+    A successful return guarantees a valid signature, an unexpired ``exp``,
+    and the presence of ``sub`` and ``type`` — callers only need to check
+    the ``type`` value.
+    """
+    payload = jwt.decode(
+        token,
+        settings.SECRET_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        options=_JWT_DECODE_OPTIONS,
+    )
+    if "type" not in payload:
+        raise JWTError("Token is missing the 'type' claim.")
+    return payload
 
 
 # ---------------------------------------------------------------------------
@@ -97,12 +128,24 @@ def generate_api_key() -> str:
 
 
 def hash_api_key(key: str) -> str:
-    """Return the SHA-256 hex digest of an API key (stored in DB)."""
+    """Return the BLAKE2b-128 hex digest of an API key (stored in DB)."""
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def hash_api_key_legacy(key: str) -> str:
+    """Return the SHA-256 hex digest used for API keys issued before BLAKE2b."""
     return hashlib.sha256(key.encode()).hexdigest()
 
 
+def is_legacy_api_key_hash(stored_hash: str) -> bool:
+    """True if *stored_hash* is a 64-char SHA-256 digest rather than BLAKE2b-128."""
+    return len(stored_hash) == 64
+
+
 def verify_api_key(plain: str, stored_hash: str) -> bool:
     """Return True if the plaintext API key matches the stored hash."""
+    if is_legacy_api_key_hash(stored_hash):
+        return hash_api_key_legacy(plain) == stored_hash
     return hash_api_key(plain) == stored_hash
 
 
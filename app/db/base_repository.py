@@ -2,17 +2,54 @@
 
 All entity repositories inherit from BaseRepository, which provides:
   - A reference to the active Neo4j session
+  - Managed read/write transaction helpers (_read_props, _read_data, _write)
   - A shared helper for serialising UUIDs and datetimes to Neo4j-safe types
+  - A batched UNWIND-based upsert for plain node labels
   - Type-safe signatures that subclasses must implement
+
+Subclasses keep their Cypher as module-level string constants so every call
+sends the identical query text and hits Neo4j's query-plan cache.
+
+Queries run through session.execute_read / execute_write rather than
+session.run: a routing driver (neo4j:// URI) can then send reads to
+followers or read replicas, and the driver retries transient failures
+(leader switches, deadlocks) by re-running the whole unit of work.  Every
+statement here is an idempotent MERGE/SET/DELETE or a read, so retries are
+safe.
 """
 
-import json
 from abc import ABC, abstractmethod
-from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from neo4j import Session
+import orjson
+from neo4j import ManagedTransaction, Record, Session
+
+# orjson rejects non-str dict keys by default; stdlib json coerced them silently.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+_PRIMITIVES = (str, bool, int, float)
+
+
+def _is_primitive_list(items: list[Any]) -> bool:
+    """True if *items* can be stored as a Neo4j array (one primitive type)."""
+    types = {type(i) for i in items}
+    return len(types) <= 1 and all(t in _PRIMITIVES for t in types)
+
+
+# Units of work for execute_read / execute_write.  Results must be fully
+# consumed inside the transaction function, so each returns plain Python data.
+
+def _fetch_records(tx: ManagedTransaction, query: str, params: dict) -> list[Record]:
+    return list(tx.run(query, params))
+
+
+def _fetch_props(tx: ManagedTransaction, query: str, params: dict) -> list[Any]:
+    return tx.run(query, params).value("props")
+
+
+def _fetch_data(tx: ManagedTransaction, query: str, params: dict) -> list[dict]:
+    return tx.run(query, params).data()
 
 
 class BaseRepository(ABC):
@@ -45,6 +82,45 @@ class BaseRepository(ABC):
     def delete(self, entity_id: UUID) -> bool:
         """Delete an entity by UUID. Return True if it existed."""
 
+    # ------------------------------------------------------------------
+    # Shared write helpers
+    # ------------------------------------------------------------------
+
+    def _upsert_nodes(self, query: str, entities: list[Any]) -> None:
+        """Run an ``UNWIND $rows AS row MERGE …`` *query* for many entities.
+
+        Rows are serialised client-side and sent as one list parameter, so
+        network latency and Cypher planning are paid once per batch rather
+        than once per entity.
+        """
+        if not entities:
+            return
+        rows = [self._to_neo4j(e) for e in entities]
+        self._write(query, rows=rows)
+
+    def _write(self, query: str, **params: Any) -> list[Record]:
+        """Run *query* in a managed write transaction; return its records."""
+        return self._session.execute_write(_fetch_records, query, params)
+
+    # ------------------------------------------------------------------
+    # Shared read helpers
+    # ------------------------------------------------------------------
+
+    def _read_props(self, query: str, **params: Any) -> list[dict[str, Any]]:
+        """Run a read *query* and decode the ``props`` column of every record.
+
+        ``Result.value`` pulls the single column out in the driver rather than
+        indexing each Record from Python.  Subclasses validate the batch with
+        a module-level ``TypeAdapter(list[Model])`` instead of one
+        ``model_validate`` per row.
+        """
+        rows = self._session.execute_read(_fetch_props, query, params)
+        return [self._from_record(p) for p in rows]
+
+    def _read_data(self, query: str, **params: Any) -> list[dict[str, Any]]:
+        """Run a read *query* and return each record as a plain dict."""
+        return self._session.execute_read(_fetch_data, query, params)
+
     # ------------------------------------------------------------------
     # Shared serialisation helpers
     # ------------------------------------------------------------------
@@ -53,29 +129,33 @@ class BaseRepository(ABC):
     def _to_neo4j(entity: Any) -> dict[str, Any]:
         """Convert a Pydantic model to a flat Neo4j-safe property dict.
 
-        - UUIDs      → str
-        - datetimes  → ISO-8601 str
-        - dicts      → JSON str  (Neo4j doesn't store nested maps natively)
-        - enums      → their .value str
+        ``model_dump(mode="json")`` does the scalar conversions in
+        pydantic-core (UUIDs → str, datetimes → ISO-8601 str, enums → value),
+        leaving only the container fields for _flatten:
+
+        - dicts      → JSON str  (Neo4j doesn't store nested maps natively;
+                       encoded with orjson, which is several times faster
+                       than stdlib json for large extra_metadata payloads)
+        - lists      → native array when all items share one primitive type,
+                       otherwise JSON str
         """
-        raw = entity.model_dump()
-        return BaseRepository._flatten(raw)
+        return BaseRepository._flatten(entity.model_dump(mode="json"))
 
     @staticmethod
     def _flatten(d: dict[str, Any]) -> dict[str, Any]:
         result: dict[str, Any] = {}
         for k, v in d.items():
-            if isinstance(v, UUID):
-                result[k] = str(v)
-            elif isinstance(v, datetime):
-                result[k] = v.isoformat()
-            elif isinstance(v, dict):
-                result[k] = json.dumps(v)
+            if isinstance(v, dict):
+                result[k] = orjson.dumps(v, option=_ORJSON_OPTS).decode()
+            elif isinstance(v, list) and _is_primitive_list(v):
+                # Neo4j stores homogeneous primitive arrays natively
+                result[k] = v
             elif isinstance(v, list):
                 # Encode list as JSON string (used for column_mappings)
-                result[k] = json.dumps(
-                    [BaseRepository._flatten(i) if isinstance(i, dict) else str(i) for i in v]
-                )
+                result[k] = orjson.dumps(
+                    [i if isinstance(i, dict) else str(i) for i in v],
+                    option=_ORJSON_OPTS,
+                ).decode()
             else:
                 result[k] = v
         return result
@@ -93,8 +173,8 @@ class BaseRepository(ABC):
                 # Attempt JSON decode for known complex fields
                 if k in ("extra_metadata", "column_mappings"):
                     try:
-                        result[k] = json.loads(v)
-                    except (json.JSONDecodeError, ValueError):
+                        result[k] = orjson.loads(v)
+                    except (orjson.JSONDecodeError, ValueError):
                         result[k] = v
                 else:
                     result[k] = v
@@ -0,0 +1,123 @@
+"""Redis-backed read-through cache for lineage traversals.
+
+Impact traversals (get_downstream / get_upstream) walk the graph on every
+call, while lineage itself changes rarely.  Results are cached in Redis,
+keyed by direction, object id, max_depth and page, for LINEAGE_CACHE_TTL_S
+seconds (0 disables the cache).
+
+Invalidation is generational rather than per key: every cached key embeds
+the current value of a single counter, and any write that can change a
+traversal result bumps it.  That orphans all previously cached traversals
+in one INCR — no SCAN or tag sets — and the orphans age out via their TTL.
+A per-node invalidation would be wrong anyway: a new A → B edge changes
+the downstream result of every ancestor of A, not just A.
+
+Redis is optional.  If it is unreachable, traversals go straight to Neo4j
+and the client is not retried for _RETRY_AFTER_S seconds, so an outage
+costs one connect timeout rather than one per request.  A write made while
+Redis is down cannot bump the counter; results cached before it may then
+be served until their TTL expires.
+
+The same client (get_client) backs the Redis check in the /health endpoint.
+"""
+
+import time
+from typing import Any, Callable
+
+import orjson
+import redis as redis_lib
+
+from app.core.config import settings
+
+_GENERATION_KEY = "ln:gen"
+_RETRY_AFTER_S = 30.0
+
+_client: redis_lib.Redis | None = None
+# time.monotonic() before which Redis is assumed to be down (0 = not down)
+_down_until: float = 0.0
+
+
+def get_client() -> redis_lib.Redis:
+    """Return (and lazily create) the module-level Redis client.
+
+    The client owns a connection pool, so callers such as the /health probe
+    reuse a warm socket instead of connecting on every call.
+    """
+    global _client
+    if _client is None:
+        _client = redis_lib.Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+    return _client
+
+
+def get_redis() -> redis_lib.Redis | None:
+    """Return the shared client for caching, or None while it is marked down."""
+    if time.monotonic() < _down_until:
+        return None
+    return get_client()
+
+
+def close_redis() -> None:
+    """Close the shared client.  Called from the FastAPI lifespan handler."""
+    global _client, _down_until
+    if _client is not None:
+        _client.close()
+        _client = None
+    _down_until = 0.0
+
+
+def _mark_down() -> None:
+    global _down_until
+    _down_until = time.monotonic() + _RETRY_AFTER_S
+
+
+def cached_traversal(
+    direction: str,
+    object_id: Any,
+    max_depth: int,
+    compute: Callable[[], list[dict]],
+    *,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[dict]:
+    """Return the cached traversal result, or run *compute* and cache it.
+
+    Each page (*limit*/*offset*) of a traversal is cached separately.
+    """
+    ttl = settings.LINEAGE_CACHE_TTL_S
+    client = get_redis() if ttl > 0 else None
+    if client is None:
+        return compute()
+
+    try:
+        generation = (client.get(_GENERATION_KEY) or b"0").decode()
+        key = f"ln:{generation}:{direction}:{object_id}:{max_depth}:{limit}:{offset}"
+        hit = client.get(key)
+    except redis_lib.RedisError:
+        _mark_down()
+        return compute()
+    if hit is not None:
+        return orjson.loads(hit)
+
+    rows = compute()
+    try:
+        client.set(key, orjson.dumps(rows), ex=ttl)
+    except redis_lib.RedisError:
+        _mark_down()
+    return rows
+
+
+def invalidate_lineage() -> None:
+    """Orphan every cached traversal by bumping the generation counter."""
+    client = get_redis() if settings.LINEAGE_CACHE_TTL_S > 0 else None
+    if client is None:
+        return
+    try:
+        client.incr(_GENERATION_KEY)
+    except redis_lib.RedisError:
+        _mark_down()
@@ -3,6 +3,12 @@
 Run once at application startup (or manually) to ensure the graph DB
 has the right uniqueness constraints and lookup indexes.
 
+The existing schema names are listed first and only the missing items are
+created, together in one managed write transaction (retried by the driver
+on transient errors).  Schema changes are serialised behind Neo4j's schema
+lock anyway, so issuing them concurrently would gain nothing and could
+fail startup on a lock conflict.
+
 Each entity type is stored as a Neo4j node label:
   DataSource | DataObject | Column | Lineage
 
@@ -10,7 +16,7 @@ Lineage *edges* (HAS_LINEAGE relationships) are stored between
 DataObject nodes, with ColumnLineageMap data serialised onto the edge.
 """
 
-from neo4j import Session
+from neo4j import ManagedTransaction, Session
 
 # Constraints guarantee uniqueness and implicitly create an index.
 # Indexes speed up property lookups that don't need to be unique.
@@ -46,10 +52,45 @@ _INDEXES = [
     "FOR (n:Column) ON (n.object_id)",
     "CREATE INDEX column_name IF NOT EXISTS "
     "FOR (n:Column) ON (n.name)",
+    "CREATE INDEX lineage_source_object_id IF NOT EXISTS "
+    "FOR (n:Lineage) ON (n.source_object_id)",
+    "CREATE INDEX lineage_target_object_id IF NOT EXISTS "
+    "FOR (n:Lineage) ON (n.target_object_id)",
 ]
 
 
+# Every uniqueness constraint is backed by an index of the same name, so one
+# listing covers both kinds of statement.
+_SHOW_INDEX_NAMES = "SHOW INDEXES YIELD name RETURN collect(name) AS names"
+
+
+def _schema_name(statement: str) -> str:
+    """Name declared by a ``CREATE CONSTRAINT|INDEX <name> IF NOT EXISTS`` statement."""
+    return statement.split()[2]
+
+
+def _missing(existing: list[str]) -> list[str]:
+    """The constraint/index statements whose names are not in *existing*."""
+    present = set(existing)
+    return [s for s in _CONSTRAINTS + _INDEXES if _schema_name(s) not in present]
+
+
+def _run_all(tx: ManagedTransaction, statements: list[str]) -> None:
+    # Schema commands may share a transaction (only mixing them with data
+    # writes is rejected), so a fresh database gets one commit, not sixteen.
+    for statement in statements:
+        tx.run(statement).consume()
+
+
 def apply_constraints_and_indexes(session: Session) -> None:
-    """Create all constraints and indexes (idempotent — safe to re-run)."""
-    for statement in _CONSTRAINTS + _INDEXES:
-        session.run(statement)
+    """Create all constraints and indexes (idempotent — safe to re-run).
+
+    Existing names are listed first and only missing items are created, so
+    on an already initialised database (every test session and script run
+    after the first) this is a single round trip.  Missing items are created
+    together in one write transaction.
+    """
+    missing = _missing(session.run(_SHOW_INDEX_NAMES).single()["names"])
+    if missing:
+        session.execute_write(_run_all, missing)
+
@@ -12,6 +12,13 @@ via environment variables or a .env file:
   NEO4J_MAX_CONNECTION_LIFETIME_S         (default 3600)
   NEO4J_CONNECTION_ACQUISITION_TIMEOUT_S  (default 60)
   NEO4J_CONNECTION_TIMEOUT_S              (default 30)
+  NEO4J_HEALTH_CACHE_TTL_S                (default 2)
+
+Connectivity checks (verify_connectivity / get_db_status) open a fresh Bolt
+connection and handshake, which is wasteful when a liveness probe hits
+/health every second or two.  A successful check is therefore trusted for
+NEO4J_HEALTH_CACHE_TTL_S seconds; failures are never cached so recovery is
+detected on the next call.
 
 Usage::
 
@@ -22,6 +29,7 @@ Usage::
         print(result.single()["total"])
 """
 
+import time
 from contextlib import contextmanager
 from typing import Any, Generator
 
@@ -30,6 +38,8 @@ from neo4j import Driver, GraphDatabase, Session
 from app.core.config import settings
 
 _driver: Driver | None = None
+# time.monotonic() of the last successful connectivity check (0 = never)
+_last_ok_at: float = 0.0
 
 
 def get_driver() -> Driver:
@@ -57,6 +67,33 @@ def close_driver() -> None:
     if _driver is not None:
         _driver.close()
         _driver = None
+    reset_health_cache()
+
+
+def reset_health_cache() -> None:
+    """Forget the last successful connectivity check (forces a fresh probe)."""
+    global _last_ok_at
+    _last_ok_at = 0.0
+
+
+def _health_cache_fresh() -> bool:
+    return (
+        _last_ok_at > 0.0
+        and time.monotonic() - _last_ok_at < settings.NEO4J_HEALTH_CACHE_TTL_S
+    )
+
+
+def _probe() -> None:
+    """Handshake with the server unless a recent probe succeeded; raises on failure."""
+    global _last_ok_at
+    if _health_cache_fresh():
+        return
+    try:
+        get_driver().verify_connectivity()
+    except Exception:
+        _last_ok_at = 0.0
+        raise
+    _last_ok_at = time.monotonic()
 
 
 @contextmanager
@@ -73,7 +110,7 @@ def get_session() -> Generator[Session, None, None]:
 def verify_connectivity() -> bool:
     """Return True if the Neo4j server is reachable, False otherwise."""
     try:
-        get_driver().verify_connectivity()
+        _probe()
         return True
     except Exception:
         return False
@@ -95,7 +132,7 @@ def get_db_status() -> dict[str, Any]:
         "error": None,
     }
     try:
-        get_driver().verify_connectivity()
+        _probe()
         status["connected"] = True
     except Exception as exc:
         status["error"] = str(exc)
@@ -2,62 +2,53 @@
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from app.db.base_repository import BaseRepository
 from app.models.schema import Column
 
+_UPSERT = "UNWIND $rows AS row MERGE (n:Column {id: row.id}) SET n += row"
+_GET_BY_ID = "MATCH (n:Column {id: $id}) RETURN properties(n) AS props"
+_LIST_ALL = "MATCH (n:Column) RETURN properties(n) AS props ORDER BY n.name"
+_LIST_BY_OBJECT = (
+    "MATCH (n:Column {object_id: $object_id}) "
+    "RETURN properties(n) AS props "
+    "ORDER BY coalesce(n.ordinal_position, 9999), n.name"
+)
+_UPDATE = "MATCH (n:Column {id: $id}) SET n += $props"
+_DELETE = "MATCH (n:Column {id: $id}) DETACH DELETE n RETURN count(n) AS deleted"
+
+_LIST_ADAPTER = TypeAdapter(list[Column])
+
 
 class ColumnRepository(BaseRepository):
 
     def create(self, entity: Column) -> Column:
-        props = self._to_neo4j(entity)
-        self._session.run(
-            "MERGE (n:Column {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self.bulk_upsert([entity])
         return entity
 
+    def bulk_upsert(self, entities: list[Column]) -> list[Column]:
+        """Create or overwrite many Column nodes in one UNWIND statement."""
+        self._upsert_nodes(_UPSERT, entities)
+        return entities
+
     def get_by_id(self, entity_id: UUID) -> Column | None:
-        result = self._session.run(
-            "MATCH (n:Column {id: $id}) RETURN properties(n) AS props",
-            id=str(entity_id),
-        )
-        record = result.single()
-        if record is None:
-            return None
-        return Column.model_validate(self._from_record(dict(record["props"])))
+        rows = self._read_props(_GET_BY_ID, id=str(entity_id))
+        return Column.model_validate(rows[0]) if rows else None
 
     def list_all(self) -> list[Column]:
-        result = self._session.run(
-            "MATCH (n:Column) RETURN properties(n) AS props ORDER BY n.name"
-        )
-        return [Column.model_validate(self._from_record(dict(r["props"]))) for r in result]
+        return _LIST_ADAPTER.validate_python(self._read_props(_LIST_ALL))
 
     def list_by_object(self, object_id: UUID) -> list[Column]:
         """Return all columns belonging to a DataObject, ordered by position."""
-        result = self._session.run(
-            "MATCH (n:Column {object_id: $object_id}) "
-            "RETURN properties(n) AS props "
-            "ORDER BY coalesce(n.ordinal_position, 9999), n.name",
-            object_id=str(object_id),
-        )
-        return [Column.model_validate(self._from_record(dict(r["props"]))) for r in result]
+        rows = self._read_props(_LIST_BY_OBJECT, object_id=str(object_id))
+        return _LIST_ADAPTER.validate_python(rows)
 
     def update(self, entity: Column) -> Column:
         props = self._to_neo4j(entity)
-        self._session.run(
-            "MATCH (n:Column {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self._write(_UPDATE, id=props["id"], props=props)
         return entity
 
     def delete(self, entity_id: UUID) -> bool:
-        result = self._session.run(
-            "MATCH (n:Column {id: $id}) "
-            "DETACH DELETE n "
-            "RETURN count(n) AS deleted",
-            id=str(entity_id),
-        )
-        record = result.single()
-        return bool(record and record["deleted"] > 0)
+        records = self._write(_DELETE, id=str(entity_id))
+        return bool(records and records[0]["deleted"] > 0)
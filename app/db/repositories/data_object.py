@@ -2,74 +2,76 @@
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from app.db.base_repository import BaseRepository
+from app.db.cache import invalidate_lineage
 from app.models.schema import DataObject, DataObjectType
 
+_UPSERT = "UNWIND $rows AS row MERGE (n:DataObject {id: row.id}) SET n += row"
+_GET_BY_ID = "MATCH (n:DataObject {id: $id}) RETURN properties(n) AS props"
+_GET_BY_IDS = (
+    "UNWIND $ids AS id MATCH (n:DataObject {id: id}) RETURN properties(n) AS props"
+)
+_LIST_ALL = "MATCH (n:DataObject) RETURN properties(n) AS props ORDER BY n.name"
+_LIST_BY_SOURCE = (
+    "MATCH (n:DataObject {source_id: $source_id}) "
+    "RETURN properties(n) AS props ORDER BY n.name"
+)
+_LIST_BY_TYPE = (
+    "MATCH (n:DataObject {object_type: $object_type}) "
+    "RETURN properties(n) AS props ORDER BY n.name"
+)
+_UPDATE = "MATCH (n:DataObject {id: $id}) SET n += $props"
+_DELETE = "MATCH (n:DataObject {id: $id}) DETACH DELETE n RETURN count(n) AS deleted"
+
+_LIST_ADAPTER = TypeAdapter(list[DataObject])
+
 
 class DataObjectRepository(BaseRepository):
 
     def create(self, entity: DataObject) -> DataObject:
-        props = self._to_neo4j(entity)
-        self._session.run(
-            "MERGE (n:DataObject {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self.bulk_upsert([entity])
         return entity
 
+    def bulk_upsert(self, entities: list[DataObject]) -> list[DataObject]:
+        """Create or overwrite many DataObject nodes in one UNWIND statement."""
+        self._upsert_nodes(_UPSERT, entities)
+        # Traversal results carry object names/types, so they may now be stale
+        invalidate_lineage()
+        return entities
+
     def get_by_id(self, entity_id: UUID) -> DataObject | None:
-        result = self._session.run(
-            "MATCH (n:DataObject {id: $id}) RETURN properties(n) AS props",
-            id=str(entity_id),
-        )
-        record = result.single()
-        if record is None:
-            return None
-        return DataObject.model_validate(self._from_record(dict(record["props"])))
+        rows = self._read_props(_GET_BY_ID, id=str(entity_id))
+        return DataObject.model_validate(rows[0]) if rows else None
+
+    def get_by_ids(self, entity_ids: list[UUID]) -> list[DataObject]:
+        """Fetch many DataObjects in one round trip; unknown ids are skipped."""
+        if not entity_ids:
+            return []
+        rows = self._read_props(_GET_BY_IDS, ids=[str(i) for i in entity_ids])
+        return _LIST_ADAPTER.validate_python(rows)
 
     def list_all(self) -> list[DataObject]:
-        result = self._session.run(
-            "MATCH (n:DataObject) RETURN properties(n) AS props ORDER BY n.name"
-        )
-        return [
-            DataObject.model_validate(self._from_record(dict(r["props"]))) for r in result
-        ]
+        return _LIST_ADAPTER.validate_python(self._read_props(_LIST_ALL))
 
     def list_by_source(self, source_id: UUID) -> list[DataObject]:
-        result = self._session.run(
-            "MATCH (n:DataObject {source_id: $source_id}) "
-            "RETURN properties(n) AS props ORDER BY n.name",
-            source_id=str(source_id),
-        )
-        return [
-            DataObject.model_validate(self._from_record(dict(r["props"]))) for r in result
-        ]
-
-    def list_by_type(self, object_type: DataObjectType) -> list[DataObject]:
-        result = self._session.run(
-            "MATCH (n:DataObject {object_type: $object_type}) "
-            "RETURN properties(n) AS props ORDER BY n.name",
-            object_type=object_type.value,
-        )
-        return [
-            DataObject.model_validate(self._from_record(dict(r["props"]))) for r in result
-        ]
+        rows = self._read_props(_LIST_BY_SOURCE, source_id=str(source_id))
+        return _LIST_ADAPTER.validate_python(rows)
+
+    def list_by_type(self, object_type: DataObjectType | str) -> list[DataObject]:
+        """Return objects of *object_type* (enum member or its raw string value)."""
+        value = object_type.value if isinstance(object_type, DataObjectType) else object_type
+        rows = self._read_props(_LIST_BY_TYPE, object_type=value)
+        return _LIST_ADAPTER.validate_python(rows)
 
     def update(self, entity: DataObject) -> DataObject:
         props = self._to_neo4j(entity)
-        self._session.run(
-            "MATCH (n:DataObject {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self._write(_UPDATE, id=props["id"], props=props)
+        invalidate_lineage()
         return entity
 
     def delete(self, entity_id: UUID) -> bool:
-        result = self._session.run(
-            "MATCH (n:DataObject {id: $id}) "
-            "DETACH DELETE n "
-            "RETURN count(n) AS deleted",
-            id=str(entity_id),
-        )
-        record = result.single()
-        return bool(record and record["deleted"] > 0)
+        records = self._write(_DELETE, id=str(entity_id))
+        invalidate_lineage()
+        return bool(records and records[0]["deleted"] > 0)
@@ -2,64 +2,53 @@
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from app.db.base_repository import BaseRepository
 from app.models.schema import DataSource, Platform
 
+_UPSERT = "UNWIND $rows AS row MERGE (n:DataSource {id: row.id}) SET n += row"
+_GET_BY_ID = "MATCH (n:DataSource {id: $id}) RETURN properties(n) AS props"
+_LIST_ALL = "MATCH (n:DataSource) RETURN properties(n) AS props ORDER BY n.name"
+_LIST_BY_PLATFORM = (
+    "MATCH (n:DataSource {platform: $platform}) "
+    "RETURN properties(n) AS props ORDER BY n.name"
+)
+_UPDATE = "MATCH (n:DataSource {id: $id}) SET n += $props"
+_DELETE = "MATCH (n:DataSource {id: $id}) DETACH DELETE n RETURN count(n) AS deleted"
+
+_LIST_ADAPTER = TypeAdapter(list[DataSource])
+
 
 class DataSourceRepository(BaseRepository):
 
     def create(self, entity: DataSource) -> DataSource:
-        props = self._to_neo4j(entity)
-        self._session.run(
-            "MERGE (n:DataSource {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self.bulk_upsert([entity])
         return entity
 
+    def bulk_upsert(self, entities: list[DataSource]) -> list[DataSource]:
+        """Create or overwrite many DataSource nodes in one UNWIND statement."""
+        self._upsert_nodes(_UPSERT, entities)
+        return entities
+
     def get_by_id(self, entity_id: UUID) -> DataSource | None:
-        result = self._session.run(
-            "MATCH (n:DataSource {id: $id}) RETURN properties(n) AS props",
-            id=str(entity_id),
-        )
-        record = result.single()
-        if record is None:
-            return None
-        return DataSource.model_validate(self._from_record(dict(record["props"])))
+        rows = self._read_props(_GET_BY_ID, id=str(entity_id))
+        return DataSource.model_validate(rows[0]) if rows else None
 
     def list_all(self) -> list[DataSource]:
-        result = self._session.run(
-            "MATCH (n:DataSource) RETURN properties(n) AS props ORDER BY n.name"
-        )
-        return [
-            DataSource.model_validate(self._from_record(dict(r["props"]))) for r in result
-        ]
+        return _LIST_ADAPTER.validate_python(self._read_props(_LIST_ALL))
 
-    def list_by_platform(self, platform: Platform) -> list[DataSource]:
-        result = self._session.run(
-            "MATCH (n:DataSource {platform: $platform}) "
-            "RETURN properties(n) AS props ORDER BY n.name",
-            platform=platform.value,
-        )
-        return [
-            DataSource.model_validate(self._from_record(dict(r["props"]))) for r in result
-        ]
+    def list_by_platform(self, platform: Platform | str) -> list[DataSource]:
+        """Return sources on *platform* (enum member or its raw string value)."""
+        value = platform.value if isinstance(platform, Platform) else platform
+        rows = self._read_props(_LIST_BY_PLATFORM, platform=value)
+        return _LIST_ADAPTER.validate_python(rows)
 
     def update(self, entity: DataSource) -> DataSource:
         props = self._to_neo4j(entity)
-        self._session.run(
-            "MATCH (n:DataSource {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self._write(_UPDATE, id=props["id"], props=props)
         return entity
 
     def delete(self, entity_id: UUID) -> bool:
-        result = self._session.run(
-            "MATCH (n:DataSource {id: $id}) "
-            "DETACH DELETE n "
-            "RETURN count(n) AS deleted",
-            id=str(entity_id),
-        )
-        record = result.single()
-        return bool(record and record["deleted"] > 0)
+        records = self._write(_DELETE, id=str(entity_id))
+        return bool(records and records[0]["deleted"] > 0)
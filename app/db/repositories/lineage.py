@@ -8,142 +8,225 @@ Each Lineage record is stored in two complementary ways:
    sql, description, etc.) for easy lookup by ID.
 
 2. A **:HAS_LINEAGE relationship** — connects the source DataObject node
-   to the target DataObject node, with the lineage id as a property.
-   This is what makes traversal queries ("what does table X affect?")
-   fast without joining through an intermediate node.
+   to the target DataObject node and carries a full copy of the scalar
+   properties plus ``lineage_id``.  This is what makes traversal queries
+   ("what does table X affect?") and per-object listings fast without
+   joining through an intermediate node.  Traversals use
+   APOC's path expander (the APOC plugin is enabled in docker-compose.yml)
+   and are cached in Redis (see app.db.cache); every write here
+   invalidates that cache.
+
+The node stays the source of truth for get/update/delete; the edge is the
+read-optimised copy, kept in step by create/update.  Edges written before
+the copy existed carry only lineage_type and column_mappings, so listings
+fall back to the node for them.
 
 ColumnLineageMap entries are serialised as a JSON string on both the
 :Lineage node and the :HAS_LINEAGE relationship for convenience.
 """
 
+from collections.abc import Iterator
+from functools import partial
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from app.db.base_repository import BaseRepository
+from app.db.cache import cached_traversal, invalidate_lineage
 from app.models.schema import Lineage
 
+_UPSERT = """
+UNWIND $rows AS row
+MERGE (n:Lineage {id: row.id}) SET n += row
+WITH row
+MATCH (src:DataObject {id: row.source_object_id})
+MATCH (tgt:DataObject {id: row.target_object_id})
+MERGE (src)-[r:HAS_LINEAGE {lineage_id: row.id}]->(tgt)
+SET r += row
+"""
+_GET_BY_ID = "MATCH (n:Lineage {id: $id}) RETURN properties(n) AS props"
+_LIST_ALL = "MATCH (n:Lineage) RETURN properties(n) AS props"
+# Listing by endpoint walks the DataObject's HAS_LINEAGE adjacency (O(degree))
+# and reads the edge's own copy of the properties.  Only legacy edges without
+# that copy (r.id IS NULL) hop to the :Lineage node.
+_LIST_BY_EDGE = """
+MATCH {pattern}
+OPTIONAL MATCH (n:Lineage {{id: r.lineage_id}}) WHERE r.id IS NULL
+RETURN CASE WHEN r.id IS NULL THEN properties(n) ELSE properties(r) END AS props
+"""
+_LIST_BY_SOURCE = _LIST_BY_EDGE.format(
+    pattern="(:DataObject {id: $id})-[r:HAS_LINEAGE]->()"
+)
+_LIST_BY_TARGET = _LIST_BY_EDGE.format(
+    pattern="()-[r:HAS_LINEAGE]->(:DataObject {id: $id})"
+)
+# The edge is located via the node's current endpoints before they are
+# overwritten; SET on a missing (null) edge is a no-op.
+_UPDATE = """
+MATCH (n:Lineage {id: $id})
+OPTIONAL MATCH (:DataObject {id: n.source_object_id})-[r:HAS_LINEAGE {lineage_id: n.id}]->()
+SET n += $props, r += $props
+"""
+_DELETE = """
+MATCH (n:Lineage {id: $id})
+WITH n, n.source_object_id AS src_id, n.target_object_id AS tgt_id, n.id AS lid
+OPTIONAL MATCH (src:DataObject {id: src_id})-[r:HAS_LINEAGE {lineage_id: lid}]->(tgt:DataObject {id: tgt_id})
+DELETE r
+DETACH DELETE n
+RETURN count(n) AS deleted
+"""
+
+_LIST_ADAPTER = TypeAdapter(list[Lineage])
+
+# Impact traversal uses APOC's path expander rather than a variable-length
+# pattern ([:HAS_LINEAGE*1..N]).  With uniqueness NODE_GLOBAL + BFS every node
+# is visited once, at its shortest depth, instead of enumerating every path
+# (exponential on diamond-shaped lineage).  maxLevel is a real parameter, so a
+# single cached plan serves every depth.  Only the fields an impact listing
+# needs are projected; full nodes can be fetched with
+# DataObjectRepository.get_by_ids.
+#
+# BFS emits paths in non-decreasing length, so results are already depth
+# ordered without an ORDER BY.  That lets pagination stop the expansion
+# early: APOC's ``limit`` caps the number of paths produced (-1 = no cap) at
+# offset + limit, and SKIP drops the rows before the requested page.
+_EXPAND = """
+MATCH (start:DataObject {{id: $id}})
+CALL apoc.path.expandConfig(start, {{
+    relationshipFilter: '{rel}',
+    labelFilter: '+DataObject',
+    minLevel: 1,
+    maxLevel: $max_depth,
+    uniqueness: 'NODE_GLOBAL',
+    bfs: true,
+    limit: $expand_limit
+}}) YIELD path
+WITH last(nodes(path)) AS n, path
+RETURN n.id AS id,
+       n.name AS name,
+       n.object_type AS object_type,
+       n.source_id AS source_id,
+       length(path) AS depth,
+       last(relationships(path)).lineage_id AS lineage_id
+SKIP $offset
+"""
+_DOWNSTREAM = _EXPAND.format(rel="HAS_LINEAGE>")
+_UPSTREAM = _EXPAND.format(rel="<HAS_LINEAGE")
+
 
 class LineageRepository(BaseRepository):
 
     def create(self, entity: Lineage) -> Lineage:
-        props = self._to_neo4j(entity)
-        self._session.run(
-            """
-            MERGE (n:Lineage {id: $id}) SET n += $props
-            WITH n
-            MATCH (src:DataObject {id: $source_id})
-            MATCH (tgt:DataObject {id: $target_id})
-            MERGE (src)-[r:HAS_LINEAGE {lineage_id: $id}]->(tgt)
-            SET r += {lineage_type: $lineage_type, column_mappings: $column_mappings}
-            """,
-            id=props["id"],
-            props=props,
-            source_id=props["source_object_id"],
-            target_id=props["target_object_id"],
-            lineage_type=props["lineage_type"],
-            column_mappings=props["column_mappings"],
-        )
+        self.bulk_upsert([entity])
         return entity
 
+    def bulk_upsert(self, entities: list[Lineage]) -> list[Lineage]:
+        """Create or overwrite many Lineage nodes and their HAS_LINEAGE edges.
+
+        One UNWIND statement for the whole batch.  An edge whose source or
+        target DataObject does not exist is silently not created (the
+        :Lineage node still is), exactly as for a single create().
+        """
+        if entities:
+            self._upsert_nodes(_UPSERT, entities)
+            invalidate_lineage()
+        return entities
+
     def get_by_id(self, entity_id: UUID) -> Lineage | None:
-        result = self._session.run(
-            "MATCH (n:Lineage {id: $id}) RETURN properties(n) AS props",
-            id=str(entity_id),
-        )
-        record = result.single()
-        if record is None:
-            return None
-        return Lineage.model_validate(self._from_record(dict(record["props"])))
+        rows = self._read_props(_GET_BY_ID, id=str(entity_id))
+        return Lineage.model_validate(rows[0]) if rows else None
 
     def list_all(self) -> list[Lineage]:
-        result = self._session.run(
-            "MATCH (n:Lineage) RETURN properties(n) AS props"
-        )
-        return [Lineage.model_validate(self._from_record(dict(r["props"]))) for r in result]
+        return _LIST_ADAPTER.validate_python(self._read_props(_LIST_ALL))
+
+    def iter_all(self) -> Iterator[Lineage]:
+        """Yield every Lineage one record at a time, as the driver streams them.
+
+        Runs as an auto-commit query (a managed transaction must be fully
+        consumed before it returns), so the caller has to exhaust the
+        iterator while this repository's session is still open.
+        """
+        for props in self._session.run(_LIST_ALL):
+            yield Lineage.model_validate(self._from_record(props["props"]))
 
     def list_by_source(self, source_object_id: UUID) -> list[Lineage]:
-        """Return all lineage edges originating from a given DataObject."""
-        result = self._session.run(
-            "MATCH (n:Lineage {source_object_id: $id}) RETURN properties(n) AS props",
-            id=str(source_object_id),
-        )
-        return [Lineage.model_validate(self._from_record(dict(r["props"]))) for r in result]
+        """Return all lineage edges originating from a given DataObject.
 
-    def list_by_target(self, target_object_id: UUID) -> list[Lineage]:
-        """Return all lineage edges pointing to a given DataObject."""
-        result = self._session.run(
-            "MATCH (n:Lineage {target_object_id: $id}) RETURN properties(n) AS props",
-            id=str(target_object_id),
-        )
-        return [Lineage.model_validate(self._from_record(dict(r["props"]))) for r in result]
+        Only lineage whose HAS_LINEAGE edge exists is returned, i.e. records
+        whose endpoints were never created or have since been deleted are
+        not listed.
+        """
+        rows = self._read_props(_LIST_BY_SOURCE, id=str(source_object_id))
+        return _LIST_ADAPTER.validate_python(rows)
 
-    def get_downstream(self, object_id: UUID, max_depth: int = 10) -> list[dict]:
+    def list_by_target(self, target_object_id: UUID) -> list[Lineage]:
+        """Return all lineage edges pointing to a given DataObject (see list_by_source)."""
+        rows = self._read_props(_LIST_BY_TARGET, id=str(target_object_id))
+        return _LIST_ADAPTER.validate_python(rows)
+
+    def get_downstream(
+        self,
+        object_id: UUID,
+        max_depth: int = 10,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict]:
         """Return all DataObject nodes reachable downstream from object_id.
 
-        Returns a list of dicts with keys: node_props, depth, lineage_id.
-
-        Note: max_depth is interpolated directly into the Cypher query because
-        Neo4j does not allow parameters in variable-length pattern ranges.
-        It is always an integer, never user-supplied string input.
-        """
-        query = f"""
-            MATCH path = (start:DataObject {{id: $id}})-[:HAS_LINEAGE*1..{max_depth}]->(downstream:DataObject)
-            RETURN properties(downstream) AS props,
-                   length(path) AS depth,
-                   last(relationships(path)).lineage_id AS lineage_id
-            ORDER BY depth
+        Returns a list of dicts with keys: id, name, object_type, source_id,
+        depth, lineage_id — one per distinct node, at its shortest depth,
+        ordered by depth.  lineage_id is the HAS_LINEAGE edge through which
+        the node was first reached.  *limit*/*offset* page through that
+        order; the traversal stops once offset + limit nodes have been found.
         """
-        result = self._session.run(query, id=str(object_id))
-        return [
-            {
-                "props": self._from_record(dict(r["props"])),
-                "depth": r["depth"],
-                "lineage_id": r["lineage_id"],
-            }
-            for r in result
-        ]
-
-    def get_upstream(self, object_id: UUID, max_depth: int = 10) -> list[dict]:
+        compute = partial(
+            self._traverse, _DOWNSTREAM, object_id, max_depth, limit, offset
+        )
+        return cached_traversal(
+            "down", object_id, max_depth, compute, limit=limit, offset=offset
+        )
+
+    def get_upstream(
+        self,
+        object_id: UUID,
+        max_depth: int = 10,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict]:
         """Return all DataObject nodes that are upstream of object_id.
 
-        Note: max_depth is interpolated directly — see get_downstream docstring.
-        """
-        query = f"""
-            MATCH path = (upstream:DataObject)-[:HAS_LINEAGE*1..{max_depth}]->(end:DataObject {{id: $id}})
-            RETURN properties(upstream) AS props,
-                   length(path) AS depth,
-                   last(relationships(path)).lineage_id AS lineage_id
-            ORDER BY depth
+        Same shape and semantics as get_downstream, traversing edges in reverse.
         """
-        result = self._session.run(query, id=str(object_id))
-        return [
-            {
-                "props": self._from_record(dict(r["props"])),
-                "depth": r["depth"],
-                "lineage_id": r["lineage_id"],
-            }
-            for r in result
-        ]
+        compute = partial(
+            self._traverse, _UPSTREAM, object_id, max_depth, limit, offset
+        )
+        return cached_traversal(
+            "up", object_id, max_depth, compute, limit=limit, offset=offset
+        )
+
+    def _traverse(
+        self,
+        query: str,
+        object_id: UUID,
+        max_depth: int,
+        limit: int | None,
+        offset: int,
+    ) -> list[dict]:
+        return self._read_data(
+            query,
+            id=str(object_id),
+            max_depth=max_depth,
+            expand_limit=-1 if limit is None else offset + limit,
+            offset=offset,
+        )
 
     def update(self, entity: Lineage) -> Lineage:
         props = self._to_neo4j(entity)
-        self._session.run(
-            "MATCH (n:Lineage {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self._write(_UPDATE, id=props["id"], props=props)
+        invalidate_lineage()
         return entity
 
     def delete(self, entity_id: UUID) -> bool:
-        result = self._session.run(
-            """
-            MATCH (n:Lineage {id: $id})
-            WITH n, n.source_object_id AS src_id, n.target_object_id AS tgt_id, n.id AS lid
-            OPTIONAL MATCH (src:DataObject {id: src_id})-[r:HAS_LINEAGE {lineage_id: lid}]->(tgt:DataObject {id: tgt_id})
-            DELETE r
-            DETACH DELETE n
-            RETURN count(n) AS deleted
-            """,
-            id=str(entity_id),
-        )
-        record = result.single()
-        return bool(record and record["deleted"] > 0)
+        records = self._write(_DELETE, id=str(entity_id))
+        invalidate_lineage()
+        return bool(records and records[0]["deleted"] > 0)
@@ -1,24 +1,40 @@
 """Repository for User nodes."""
 
+import sys
 from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from app.db.base_repository import BaseRepository
 
+_CREATE = "CREATE (n:User {id: $id}) SET n += $props"
+# Keyed on email (unique): creates the user unless that email already exists.
+_CREATE_IF_ABSENT = """
+MERGE (n:User {email: $props.email})
+ON CREATE SET n += $props
+RETURN n.id = $props.id AS created
+"""
+_GET_BY_ID = "MATCH (n:User {id: $id}) RETURN properties(n) AS props"
+_GET_BY_EMAIL = "MATCH (n:User {email: $email}) RETURN properties(n) AS props"
+_GET_BY_API_KEY_HASH = "MATCH (n:User {api_key_hash: $hash}) RETURN properties(n) AS props"
+_LIST_ALL = "MATCH (n:User) RETURN properties(n) AS props ORDER BY n.email"
+_UPDATE = "MATCH (n:User {id: $id}) SET n += $props"
+_DELETE = "MATCH (n:User {id: $id}) DELETE n RETURN count(n) AS deleted"
+_COUNT = "MATCH (n:User) RETURN count(n) AS cnt"
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
 class UserRole:
-    ADMIN = "admin"
-    USER = "user"
-    SERVICE = "service"
+    ADMIN = sys.intern("admin")
+    USER = sys.intern("user")
+    SERVICE = sys.intern("service")
 
-    ALL = {ADMIN, USER, SERVICE}
+    ALL = frozenset({ADMIN, USER, SERVICE})
 
 
 class User(BaseModel):
@@ -36,72 +52,57 @@ class User(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @field_validator("role")
+    @classmethod
+    def _intern_role(cls, v: str) -> str:
+        # Roles loaded from Neo4j are fresh str objects; interning them makes
+        # the per-request ``role == UserRole.ADMIN`` checks an identity hit.
+        return sys.intern(v)
+
+
+_LIST_ADAPTER = TypeAdapter(list[User])
+
 
 class UserRepository(BaseRepository):
 
     def create(self, entity: User) -> User:
         props = self._to_neo4j(entity)
-        self._session.run(
-            "CREATE (n:User {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self._write(_CREATE, id=props["id"], props=props)
         return entity
 
+    def create_if_absent(self, entity: User) -> bool:
+        """Create *entity* unless a user with its email exists; True if created.
+
+        A single MERGE, so concurrent callers cannot both pass an existence
+        check and then collide on the email uniqueness constraint.
+        """
+        records = self._write(_CREATE_IF_ABSENT, props=self._to_neo4j(entity))
+        return bool(records and records[0]["created"])
+
     def get_by_id(self, entity_id: UUID) -> User | None:
-        result = self._session.run(
-            "MATCH (n:User {id: $id}) RETURN properties(n) AS props",
-            id=str(entity_id),
-        )
-        record = result.single()
-        if record is None:
-            return None
-        return User.model_validate(self._from_record(dict(record["props"])))
+        rows = self._read_props(_GET_BY_ID, id=str(entity_id))
+        return User.model_validate(rows[0]) if rows else None
 
     def get_by_email(self, email: str) -> User | None:
-        result = self._session.run(
-            "MATCH (n:User {email: $email}) RETURN properties(n) AS props",
-            email=email.lower(),
-        )
-        record = result.single()
-        if record is None:
-            return None
-        return User.model_validate(self._from_record(dict(record["props"])))
+        rows = self._read_props(_GET_BY_EMAIL, email=email.lower())
+        return User.model_validate(rows[0]) if rows else None
 
     def get_by_api_key_hash(self, api_key_hash: str) -> User | None:
-        result = self._session.run(
-            "MATCH (n:User {api_key_hash: $hash}) RETURN properties(n) AS props",
-            hash=api_key_hash,
-        )
-        record = result.single()
-        if record is None:
-            return None
-        return User.model_validate(self._from_record(dict(record["props"])))
+        rows = self._read_props(_GET_BY_API_KEY_HASH, hash=api_key_hash)
+        return User.model_validate(rows[0]) if rows else None
 
     def list_all(self) -> list[User]:
-        result = self._session.run(
-            "MATCH (n:User) RETURN properties(n) AS props ORDER BY n.email"
-        )
-        return [User.model_validate(self._from_record(dict(r["props"]))) for r in result]
+        return _LIST_ADAPTER.validate_python(self._read_props(_LIST_ALL))
 
     def update(self, entity: User) -> User:
         props = self._to_neo4j(entity)
-        self._session.run(
-            "MATCH (n:User {id: $id}) SET n += $props",
-            id=props["id"],
-            props=props,
-        )
+        self._write(_UPDATE, id=props["id"], props=props)
         return entity
 
     def delete(self, entity_id: UUID) -> bool:
-        result = self._session.run(
-            "MATCH (n:User {id: $id}) DELETE n RETURN count(n) AS deleted",
-            id=str(entity_id),
-        )
-        record = result.single()
-        return bool(record and record["deleted"] > 0)
+        records = self._write(_DELETE, id=str(entity_id))
+        return bool(records and records[0]["deleted"] > 0)
 
     def count(self) -> int:
-        result = self._session.run("MATCH (n:User) RETURN count(n) AS cnt")
-        record = result.single()
-        return int(record["cnt"]) if record else 0
+        rows = self._read_data(_COUNT)
+        return int(rows[0]["cnt"]) if rows else 0
@@ -1,7 +1,8 @@
+import asyncio
+import time
 from contextlib import asynccontextmanager
 from typing import Any
 
-import redis as redis_lib
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -17,20 +18,33 @@ from app.core.errors import (
     not_found_handler,
     unprocessable_handler,
 )
-from app.core.security import hash_password
+from app.core.security import hash_password, warmup_password_hashing
+from app.db.cache import close_redis, get_client as get_redis_client
 from app.db.constraints import apply_constraints_and_indexes
 from app.db.neo4j import close_driver, get_db_status, get_session
 from app.db.repositories.user import User, UserRepository, UserRole
 
 
+def _apply_schema() -> None:
+    with get_session() as session:
+        apply_constraints_and_indexes(session)
+
+
 def _seed_first_admin() -> None:
-    """Create the bootstrap admin user if no users exist in the database."""
+    """Create the bootstrap admin user if no users exist in the database.
+
+    Uses FIRST_ADMIN_PASSWORD_HASH when provided, so a cold start against an
+    empty database doesn't pay a full-cost bcrypt hash inside the lifespan.
+    """
     with get_session() as session:
         repo = UserRepository(session)
         if repo.count() == 0:
+            hashed = settings.FIRST_ADMIN_PASSWORD_HASH or hash_password(
+                settings.FIRST_ADMIN_PASSWORD
+            )
             admin = User(
                 email=settings.FIRST_ADMIN_EMAIL.lower(),
-                hashed_password=hash_password(settings.FIRST_ADMIN_PASSWORD),
+                hashed_password=hashed,
                 role=UserRole.ADMIN,
                 full_name="Bootstrap Admin",
             )
@@ -39,10 +53,12 @@ def _seed_first_admin() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    with get_session() as session:
-        apply_constraints_and_indexes(session)
+    warmup_password_hashing()
+    # Blocking driver I/O; keep it off the event loop.
+    await asyncio.to_thread(_apply_schema)
     _seed_first_admin()
     yield
+    close_redis()
     close_driver()
 
 
@@ -81,20 +97,35 @@ app.include_router(connectors.router, prefix=settings.API_V1_STR)
 def _redis_status() -> dict[str, Any]:
     status: dict[str, Any] = {"connected": False, "url": settings.REDIS_URL, "error": None}
     try:
-        r = redis_lib.from_url(settings.REDIS_URL, socket_connect_timeout=2)
-        r.ping()
+        get_redis_client().ping()
         status["connected"] = True
     except Exception as exc:
         status["error"] = str(exc)
     return status
 
 
+# (time.monotonic() when computed, response) of the last healthy /health
+_last_health: tuple[float, dict] | None = None
+
+
 @app.get("/health", tags=["health"])
 async def health_check() -> dict:
-    neo4j = get_db_status()
-    redis = _redis_status()
+    global _last_health
+    # Liveness/readiness probes and load balancers hit this continuously; the
+    # answer rarely changes, so reuse it for HEALTH_CACHE_TTL_S seconds.  Only
+    # a healthy answer is reused (as in the Neo4j probe cache), so an outage
+    # is never masked once noticed and recovery shows on the next call.
+    now = time.monotonic()
+    if _last_health is not None and now - _last_health[0] < settings.HEALTH_CACHE_TTL_S:
+        return _last_health[1]
+
+    # Both probes block on a socket round-trip; run them side by side in
+    # worker threads so neither stalls the event loop.
+    neo4j, redis = await asyncio.gather(
+        asyncio.to_thread(get_db_status), asyncio.to_thread(_redis_status)
+    )
     all_healthy = neo4j["connected"] and redis["connected"]
-    return {
+    body = {
         "status": "ok" if all_healthy else "degraded",
         "version": settings.VERSION,
         "services": {
@@ -102,3 +133,5 @@ async def health_check() -> dict:
             "redis": redis,
         },
     }
+    _last_health = (now, body) if all_healthy else None
+    return body
@@ -19,8 +19,14 @@ from app.models.validators import (
     OBJECT_TYPE_METADATA_SCHEMAS,
     PLATFORM_METADATA_SCHEMAS,
     get_object_type_schema,
+    get_object_type_validator,
     get_platform_schema,
+    get_platform_validator,
     validate_metadata,
+    validate_metadata_batch,
+    validate_metadata_batch_first_error,
+    validate_object_type_metadata,
+    validate_platform_metadata,
 )
 
 __all__ = [
@@ -42,6 +48,12 @@ __all__ = [
     "PLATFORM_METADATA_SCHEMAS",
     "OBJECT_TYPE_METADATA_SCHEMAS",
     "validate_metadata",
+    "validate_metadata_batch",
+    "validate_metadata_batch_first_error",
+    "validate_platform_metadata",
+    "validate_object_type_metadata",
     "get_platform_schema",
     "get_object_type_schema",
+    "get_platform_validator",
+    "get_object_type_validator",
 ]
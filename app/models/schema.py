@@ -17,7 +17,7 @@ from enum import Enum
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, computed_field, field_validator
+from pydantic import BaseModel, Field, computed_field, model_validator
 
 CURRENT_SCHEMA_VERSION = "1.1.0"
 
@@ -179,9 +179,8 @@ class Lineage(LineageBaseModel):
     description: Optional[str] = None
     extra_metadata: dict[str, Any] = Field(default_factory=dict)
 
-    @field_validator("target_object_id")
-    @classmethod
-    def source_and_target_must_differ(cls, v: UUID, info: Any) -> UUID:
-        if "source_object_id" in info.data and v == info.data["source_object_id"]:
+    @model_validator(mode="after")
+    def source_and_target_must_differ(self) -> "Lineage":
+        if self.source_object_id == self.target_object_id:
             raise ValueError("source_object_id and target_object_id must be different")
-        return v
+        return self
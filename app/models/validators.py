@@ -3,21 +3,36 @@
 Each entry in PLATFORM_METADATA_SCHEMAS / OBJECT_TYPE_METADATA_SCHEMAS defines
 the *optional* additional properties that the extra_metadata dict may carry for a
 given platform or object type.  All schemas use ``additionalProperties: true`` so
-that unknown keys are accepted (forward-compatibility).
+that unknown keys are accepted (forward-compatibility).  The registries and
+get_*_schema results are plain dicts (JSON-serialisable, safe to copy and
+merge).  get_*_schema returns the registry's own dict, so copy it before
+editing; the validators are compiled from a frozen snapshot taken at import,
+so even an edit in place never changes what a compiled validator checks.
+
+Every schema is compiled once, on first use, by fastjsonschema into a
+plain Python function specialised for that schema; validation is then a
+single call into generated straight-line code (sub-microsecond for the
+schemas here) instead of a walk over the schema by a generic validator.
 
 Usage::
 
-    from app.models.validators import validate_metadata, PLATFORM_METADATA_SCHEMAS
-    errors = validate_metadata(data_source.extra_metadata,
-                               PLATFORM_METADATA_SCHEMAS["postgresql"])
+    from app.models.validators import validate_platform_metadata
+    errors = validate_platform_metadata(data_source.extra_metadata, "postgresql")
     if errors:
         raise ValueError(errors)
 """
 
-from typing import Any
+import functools
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, Callable
+
+import fastjsonschema
+import orjson
 
-import jsonschema
-from jsonschema import ValidationError
+# A compiled validator returns the (possibly defaulted) data or raises
+# fastjsonschema.JsonSchemaValueException.
+Validator = Callable[[Any], Any]
 
 # ---------------------------------------------------------------------------
 # Platform-level metadata schemas
@@ -186,31 +201,232 @@ OBJECT_TYPE_METADATA_SCHEMAS: dict[str, dict[str, Any]] = {
 
 
 # ---------------------------------------------------------------------------
-# Validation helper
+# Compiled validators
 # ---------------------------------------------------------------------------
 
 
-def validate_metadata(metadata: dict[str, Any], schema: dict[str, Any]) -> list[str]:
+def _thaw(value: Any) -> Any:
+    """Return a plain dict/list copy of *value*, as fastjsonschema requires."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _compile(schema: Mapping[str, Any]) -> Validator:
+    """Generate and return a validator function for *schema*."""
+    return fastjsonschema.compile(_thaw(schema))
+
+
+def _freeze(value: Any) -> Any:
+    """Return a deep read-only copy of a JSON-like *value*."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _key(schema: Mapping[str, Any]) -> bytes | None:
+    """Canonical JSON of *schema*, or None if it is not JSON-serialisable."""
+    try:
+        return orjson.dumps(_thaw(schema), option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+
+
+# Frozen snapshots of the registry schemas, keyed by content, as compiled
+# into the registry validators.  Keying by content lets validate_metadata
+# reuse a compiled validator for any equal dict, such as a copy of one.
+_REGISTRY_SCHEMAS: dict[bytes, Mapping[str, Any]] = {}
+
+# id() of each registry dict → (the dict, its key).  get_*_schema hands out
+# these very dicts, so the common case skips serialising the schema to find
+# its key.  Holding the dict keeps its id from being reused by another object.
+_REGISTRY_IDS: dict[int, tuple[dict[str, Any], bytes]] = {}
+
+
+def _snapshot(registry: dict[str, dict[str, Any]]) -> dict[str, bytes]:
+    """Freeze each schema of *registry* into _REGISTRY_SCHEMAS; map name → key."""
+    keys = {}
+    for name, schema in registry.items():
+        key = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        _REGISTRY_SCHEMAS[key] = _freeze(schema)
+        _REGISTRY_IDS[id(schema)] = (schema, key)
+        keys[name] = key
+    return keys
+
+
+_PLATFORM_KEYS = _snapshot(PLATFORM_METADATA_SCHEMAS)
+_OBJECT_TYPE_KEYS = _snapshot(OBJECT_TYPE_METADATA_SCHEMAS)
+
+# Registry validators known to accept empty metadata (all of them today: no
+# schema has a ``required`` list).  Most stored objects carry no
+# extra_metadata, so validate_metadata answers for those without a call.
+_ACCEPTS_EMPTY: set[Validator] = set()
+
+
+def _accepts_empty(validator: Validator) -> bool:
+    try:
+        validator({})
+    except fastjsonschema.JsonSchemaValueException:
+        return False
+    return True
+
+
+@functools.cache
+def _registry_validator(key: bytes) -> Validator:
+    """Compile a registry schema on first use and keep the validator.
+
+    Not done at import: compiling every schema costs ~20 ms, which every
+    process importing app.models (CLI scripts, workers) would pay whether or
+    not it ever validates metadata.
+    """
+    validator = _compile(_REGISTRY_SCHEMAS[key])
+    if _accepts_empty(validator):
+        _ACCEPTS_EMPTY.add(validator)
+    return validator
+
+
+@functools.lru_cache(maxsize=128)
+def _adhoc_validator(key: bytes) -> Validator:
+    """Compile an ad-hoc schema, given as its canonical JSON, and keep it.
+
+    Bounded because callers may derive any number of distinct schemas; a
+    caller that reuses a handful of them pays for each compile only once.
+    """
+    return fastjsonschema.compile(orjson.loads(key))
+
+
+# ---------------------------------------------------------------------------
+# Validation helpers
+# ---------------------------------------------------------------------------
+
+
+def _resolve(schema: Mapping[str, Any] | Validator) -> Validator:
+    """Return the compiled validator for *schema* (compiling ad-hoc schemas).
+
+    Ad-hoc schemas are cached by content; one that is not JSON-serialisable
+    cannot be keyed and is compiled on every call.
+
+    Raises fastjsonschema.JsonSchemaDefinitionException for an invalid schema.
+    """
+    if isinstance(schema, Mapping):
+        entry = _REGISTRY_IDS.get(id(schema))
+        if entry is not None:
+            return _registry_validator(entry[1])
+        key = _key(schema)
+        if key is None:
+            return _compile(schema)
+        if key in _REGISTRY_SCHEMAS:
+            return _registry_validator(key)
+        return _adhoc_validator(key)
+    return schema
+
+
+def _check(validator: Validator, metadata: dict[str, Any]) -> list[str]:
+    if not metadata and validator in _ACCEPTS_EMPTY:
+        return []
+    try:
+        validator(metadata)
+    except fastjsonschema.JsonSchemaValueException as exc:
+        return [exc.message]
+    return []
+
+
+def validate_metadata(
+    metadata: dict[str, Any], schema: Mapping[str, Any] | Validator
+) -> list[str]:
     """Validate *metadata* against *schema* using JSON Schema Draft 7.
 
+    *schema* may be a schema mapping or an already compiled validator.  Registry
+    schemas are served from the precompiled cache; any other dict is checked
+    and compiled on first use, then cached by content.  Empty (or None) metadata is accepted without
+    running a registry validator that is known to allow it.
+
     Returns a (possibly empty) list of human-readable error messages.
     An empty list means the data is valid.
     """
-    errors: list[str] = []
     try:
-        jsonschema.validate(instance=metadata, schema=schema)
-    except ValidationError as exc:
-        errors.append(exc.message)
-    except jsonschema.SchemaError as exc:
-        errors.append(f"Invalid schema definition: {exc.message}")
-    return errors
+        validator = _resolve(schema)
+    except fastjsonschema.JsonSchemaDefinitionException as exc:
+        return [f"Invalid schema definition: {exc}"]
+    return _check(validator, metadata)
+
+
+def validate_metadata_batch(
+    items: Iterable[dict[str, Any]], schema: Mapping[str, Any] | Validator
+) -> list[list[str]]:
+    """Validate every metadata dict in *items* against one *schema*.
+
+    The validator is resolved (or compiled) once for the whole batch.
+    Returns one error list per item, in order, as validate_metadata would.
+    """
+    try:
+        validator = _resolve(schema)
+    except fastjsonschema.JsonSchemaDefinitionException as exc:
+        return [[f"Invalid schema definition: {exc}"] for _ in items]
+    return [_check(validator, m) for m in items]
+
+
+def validate_metadata_batch_first_error(
+    items: Iterable[dict[str, Any]], schema: Mapping[str, Any] | Validator
+) -> tuple[int, list[str]] | None:
+    """Return ``(index, errors)`` for the first invalid item, or None.
+
+    Stops at the first failure, for imports that reject the whole batch.
+    """
+    try:
+        validator = _resolve(schema)
+    except fastjsonschema.JsonSchemaDefinitionException as exc:
+        return 0, [f"Invalid schema definition: {exc}"]
+    for i, m in enumerate(items):
+        errors = _check(validator, m)
+        if errors:
+            return i, errors
+    return None
+
+
+def validate_platform_metadata(metadata: dict[str, Any], platform: str) -> list[str]:
+    """Validate *metadata* for *platform*; platforms without a schema pass."""
+    validator = get_platform_validator(platform)
+    return [] if validator is None else validate_metadata(metadata, validator)
+
+
+def validate_object_type_metadata(
+    metadata: dict[str, Any], object_type: str
+) -> list[str]:
+    """Validate *metadata* for *object_type*; types without a schema pass."""
+    validator = get_object_type_validator(object_type)
+    return [] if validator is None else validate_metadata(metadata, validator)
+
+
+# Callers pass a handful of distinct platform / object-type strings in tight
+# loops, so the lookups (lowercasing included) are memoised per raw string.
+
+
+@functools.lru_cache(maxsize=64)
+def get_platform_validator(platform: str) -> Validator | None:
+    """Return the compiled validator for *platform*, or None if not defined."""
+    key = _PLATFORM_KEYS.get(platform.lower())
+    return None if key is None else _registry_validator(key)
+
+
+@functools.lru_cache(maxsize=64)
+def get_object_type_validator(object_type: str) -> Validator | None:
+    """Return the compiled validator for *object_type*, or None if not defined."""
+    key = _OBJECT_TYPE_KEYS.get(object_type.lower())
+    return None if key is None else _registry_validator(key)
 
 
+@functools.lru_cache(maxsize=64)
 def get_platform_schema(platform: str) -> dict[str, Any] | None:
     """Return the JSON schema for *platform*, or None if not defined."""
     return PLATFORM_METADATA_SCHEMAS.get(platform.lower())
 
 
+@functools.lru_cache(maxsize=64)
 def get_object_type_schema(object_type: str) -> dict[str, Any] | None:
     """Return the JSON schema for *object_type*, or None if not defined."""
     return OBJECT_TYPE_METADATA_SCHEMAS.get(object_type.lower())
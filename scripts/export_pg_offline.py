@@ -69,8 +69,7 @@ def main() -> None:
     print(f"  Views:    {summary['views']}")
     print(f"  Functions:{summary['functions']}")
     print(f"  Files written to: {summary['output_folder']}")
-    for fname, fpath in summary["files"].items():
-        size = os.path.getsize(fpath) if isinstance(fpath, str) else 0
+    for fname, size in summary["file_sizes"].items():
         print(f"    {fname}: {size:,} bytes")
     print("\nDone. Use --folder-path with the offline connector to import.")
 
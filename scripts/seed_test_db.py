@@ -5,16 +5,27 @@ Creates three schemas:
   dw   — 15 dimension + fact tables
   rpt  — 15 views/materialized views + 2 stored functions
 
+--profile seeds a subset (default: full):
+  full     — everything above
+  lineage  — raw + rpt (the rpt views only read raw; dw is skipped)
+  minimal  — raw tables only
+
 Usage:
   python3 scripts/seed_test_db.py [--host localhost] [--port 5433] \
-      [--dbname lineage_sample] [--user lineage] [--password lineage]
+      [--dbname lineage_sample] [--user lineage] [--password lineage] \
+      [--profile full]
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
+from typing import TYPE_CHECKING
 
-import psycopg2
-from psycopg2.extensions import connection as PgConnection
+# psycopg2 (~20 ms to import) is only needed to connect; importing this
+# module for build_ddl / PROFILES does not pay for it.
+if TYPE_CHECKING:
+    from psycopg2.extensions import connection as PgConnection
 
 
 # ---------------------------------------------------------------------------
@@ -142,7 +153,9 @@ CREATE TABLE raw.orders (
     total_amt     NUMERIC(12,2),
     notes         TEXT
 );
-CREATE INDEX idx_raw_orders_customer ON raw.orders(customer_id);
+-- Covering: lets rpt.v_customer_orders aggregate per customer index-only.
+CREATE INDEX idx_raw_orders_customer ON raw.orders(customer_id)
+    INCLUDE (order_id, order_date, total_amt, status);
 CREATE INDEX idx_raw_orders_date     ON raw.orders(order_date);
 CREATE INDEX idx_raw_orders_status   ON raw.orders(status);
 
@@ -156,7 +169,9 @@ CREATE TABLE raw.order_items (
     line_total    NUMERIC(12,2)
 );
 CREATE INDEX idx_raw_order_items_order   ON raw.order_items(order_id);
-CREATE INDEX idx_raw_order_items_product ON raw.order_items(product_id);
+-- Covering: rpt.v_product_performance reads only these per product.
+CREATE INDEX idx_raw_order_items_product ON raw.order_items(product_id)
+    INCLUDE (order_item_id, quantity, line_total);
 
 CREATE TABLE raw.payments (
     payment_id    SERIAL PRIMARY KEY,
@@ -702,6 +717,8 @@ CREATE UNIQUE INDEX idx_mv_inventory_product ON rpt.mv_inventory_snapshot(produc
 
 FUNCTIONS = """
 -- ---- stored functions --------------------------------------------------
+-- Single-SELECT, STABLE SQL functions: the planner can inline them into the
+-- calling query (PL/pgSQL bodies are opaque to it).
 
 CREATE OR REPLACE FUNCTION rpt.fn_customer_order_stats(p_customer_id INT)
 RETURNS TABLE(
@@ -710,9 +727,7 @@ RETURNS TABLE(
     avg_order_value NUMERIC,
     first_order     TIMESTAMP,
     last_order      TIMESTAMP
-) LANGUAGE plpgsql AS $$
-BEGIN
-    RETURN QUERY
+) LANGUAGE sql STABLE AS $$
     SELECT
         COUNT(o.order_id)::BIGINT,
         SUM(o.total_amt),
@@ -722,7 +737,6 @@ BEGIN
     FROM raw.orders o
     WHERE o.customer_id = p_customer_id
       AND o.status NOT IN ('cancelled');
-END;
 $$;
 
 CREATE OR REPLACE FUNCTION rpt.fn_product_revenue_rank(p_category_id INT)
@@ -731,9 +745,7 @@ RETURNS TABLE(
     product_name VARCHAR,
     revenue      NUMERIC,
     rank_pos     BIGINT
-) LANGUAGE plpgsql AS $$
-BEGIN
-    RETURN QUERY
+) LANGUAGE sql STABLE AS $$
     SELECT
         p.product_id,
         p.name,
@@ -743,71 +755,77 @@ BEGIN
     LEFT JOIN raw.order_items oi ON oi.product_id = p.product_id
     WHERE p.category_id = p_category_id
     GROUP BY p.product_id, p.name;
-END;
 $$;
 """
 
+SCHEMAS = """
+-- ---- schemas -------------------------------------------------------------
+
+-- Throwaway test data: the commit need not wait for the WAL flush, and the
+-- DROP ... IF EXISTS notices are noise.
+SET LOCAL synchronous_commit = off;
+SET LOCAL client_min_messages = warning;
+
+DROP SCHEMA IF EXISTS rpt, dw, raw CASCADE;
+CREATE SCHEMA raw;
+CREATE SCHEMA dw;
+CREATE SCHEMA rpt;
+"""
+
+PROFILES: dict[str, tuple[str, ...]] = {
+    "full": (RAW_TABLES, DW_TABLES, RPT_VIEWS, FUNCTIONS),
+    "lineage": (RAW_TABLES, RPT_VIEWS, FUNCTIONS),
+    "minimal": (RAW_TABLES,),
+}
+
+
+def build_ddl(profile: str = "full") -> str:
+    """Assemble the DDL script for *profile* (always recreating all schemas).
+
+    Sections keep their "-- ---- <name> ----" headers, so an error position
+    reported by Postgres can still be traced to its section.
+    """
+    return "\n".join((SCHEMAS, *PROFILES[profile]))
+
 
 # ---------------------------------------------------------------------------
 # Main logic
 # ---------------------------------------------------------------------------
 
-def run(conn: PgConnection) -> None:
-    cur = conn.cursor()
-
-    print("Dropping and recreating schemas...")
-    for schema in ("rpt", "dw", "raw"):
-        cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
-    for schema in ("raw", "dw", "rpt"):
-        cur.execute(f"CREATE SCHEMA {schema}")
-    conn.commit()
-
-    print("Creating raw tables (20)...")
-    cur.execute(RAW_TABLES)
-    conn.commit()
-
-    print("Creating dw tables (15)...")
-    cur.execute(DW_TABLES)
-    conn.commit()
-
-    print("Creating rpt views, materialized views, and functions...")
-    cur.execute(RPT_VIEWS)
-    cur.execute(FUNCTIONS)
-    conn.commit()
-
-    # Summary counts
-    cur.execute("""
-        SELECT table_schema, table_type, COUNT(*)
-        FROM information_schema.tables
-        WHERE table_schema IN ('raw','dw','rpt')
-        GROUP BY table_schema, table_type
-        ORDER BY table_schema, table_type
-    """)
-    rows = cur.fetchall()
-
-    cur.execute("""
-        SELECT COUNT(*) FROM pg_proc p
-        JOIN pg_namespace n ON n.oid = p.pronamespace
-        WHERE n.nspname = 'rpt'
-    """)
-    func_count = cur.fetchone()[0]
-
-    cur.close()
+def run(conn: PgConnection, profile: str = "full") -> None:
+    print(f"Recreating schemas raw, dw, rpt ({profile} profile)...")
+    # One round trip and one commit for the whole DDL script; it is applied
+    # atomically, so a failure leaves the previous schemas untouched.
+    with conn, conn.cursor() as ddl:
+        ddl.execute(build_ddl(profile))
+
+    # Summary counts, in one round trip
+    with conn.cursor() as cur:
+        cur.execute("""
+            WITH t AS (
+                -- cast: psycopg2 has no array adapter for sql_identifier
+                SELECT table_schema::text AS table_schema, table_type::text AS table_type
+                FROM information_schema.tables
+                WHERE table_schema IN ('raw','dw','rpt')
+            )
+            SELECT
+                (SELECT array_agg(DISTINCT table_schema ORDER BY table_schema) FROM t),
+                (SELECT COUNT(*) FROM t WHERE table_type = 'BASE TABLE'),
+                (SELECT COUNT(*) FROM t WHERE table_type = 'VIEW'),
+                -- mat views show up in pg_matviews, not information_schema.tables
+                (SELECT COUNT(*) FROM pg_matviews WHERE schemaname = 'rpt'),
+                (SELECT COUNT(*) FROM pg_proc p
+                 JOIN pg_namespace n ON n.oid = p.pronamespace
+                 WHERE n.nspname = 'rpt')
+        """)
+        schema_names, table_count, view_count, matview_count, func_count = cur.fetchone()
+    schema_names = schema_names or []
 
     print("\n=== Seed Summary ===")
-    schema_names = set()
-    table_count = view_count = matview_count = 0
-    for schema, ttype, cnt in rows:
-        schema_names.add(schema)
-        if ttype == "BASE TABLE":
-            table_count += cnt
-        elif ttype == "VIEW":
-            view_count += cnt
-    # mat views show up in pg_matviews, not information_schema.tables with VIEW type
-    print(f"  Schemas: {len(schema_names)} ({', '.join(sorted(schema_names))})")
+    print(f"  Schemas: {len(schema_names)} ({', '.join(schema_names)})")
     print(f"  Tables:  {table_count}")
     print(f"  Views:   {view_count}")
-    print(f"  Materialized views: 2 (mv_daily_sales, mv_inventory_snapshot)")
+    print(f"  Materialized views: {matview_count}")
     print(f"  Functions: {func_count}")
     print("Done.\n")
 
@@ -819,10 +837,13 @@ def main() -> None:
     parser.add_argument("--dbname",   default="lineage_sample")
     parser.add_argument("--user",     default="lineage")
     parser.add_argument("--password", default="lineage")
+    parser.add_argument("--profile",  choices=sorted(PROFILES), default="full")
     args = parser.parse_args()
 
     dsn = f"host={args.host} port={args.port} dbname={args.dbname} user={args.user} password={args.password}"
     print(f"Connecting to PostgreSQL at {args.host}:{args.port}/{args.dbname}...")
+    import psycopg2
+
     try:
         conn = psycopg2.connect(dsn)
     except Exception as exc:
@@ -830,7 +851,7 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        run(conn)
+        run(conn, args.profile)
     finally:
         conn.close()
 
@@ -2,32 +2,209 @@
 
 Ensures the bootstrap admin user exists before any test runs, even when
 the test client's ASGI lifespan hasn't fired yet.
+
+Modules that need Neo4j carry the ``neo4j`` marker.  Neo4j is probed once
+per run, after collection and only if such tests were collected, and the
+marked tests are skipped when it is down.  The connect timeout is lowered
+for the test run (unless set explicitly), so a missing or unroutable server
+costs about a second rather than the production default of 30.
 """
 
+import functools
+import os
+from datetime import timedelta
+from uuid import uuid4
+
 import pytest
+from httpx import ASGITransport, AsyncClient
 
 from app.core.config import settings
-from app.core.security import hash_password
+from app.core.security import (
+    create_access_token,
+    generate_api_key,
+    hash_api_key,
+    hash_password,
+)
 from app.db.constraints import apply_constraints_and_indexes
 from app.db.neo4j import get_session, verify_connectivity
+from app.db.repositories.data_object import DataObjectRepository
+from app.db.repositories.data_source import DataSourceRepository
 from app.db.repositories.user import User, UserRepository, UserRole
+from app.main import app
+from app.models.schema import DataObject, DataObjectType, DataSource, Platform
+
+# Conftest is imported before the test modules, and the driver is created
+# lazily, so this applies to every probe and session in the run.
+if "NEO4J_CONNECTION_TIMEOUT_S" not in os.environ:
+    settings.NEO4J_CONNECTION_TIMEOUT_S = 1.0
+
+# bcrypt's minimum cost.  The hash's own cost also sets the price of every
+# verify_password, i.e. of each admin login the tests perform.
+_TEST_ROUNDS = 4
+
+# Outlasts any test run, so a session-scoped token never needs refreshing.
+_TOKEN_LIFETIME = timedelta(hours=12)
+
+_NEO4J_DOWN = "Neo4j is not reachable — start docker compose up -d"
+
+
+@functools.cache
+def neo4j_available() -> bool:
+    """Probe Neo4j once per test run; the answer is reused by every caller."""
+    return verify_connectivity()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "neo4j: test needs a reachable Neo4j server")
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    needs_neo4j = [item for item in items if item.get_closest_marker("neo4j")]
+    if needs_neo4j and not neo4j_available():
+        skip = pytest.mark.skip(reason=_NEO4J_DOWN)
+        for item in needs_neo4j:
+            item.add_marker(skip)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def ensure_admin_user():
     """Create constraints and seed the bootstrap admin once per test session."""
-    if not verify_connectivity():
+    if not neo4j_available():
         return  # Integration tests will be skipped anyway
 
     with get_session() as session:
         apply_constraints_and_indexes(session)
         repo = UserRepository(session)
-        existing = repo.get_by_email(settings.FIRST_ADMIN_EMAIL.lower())
-        if existing is None:
+        email = settings.FIRST_ADMIN_EMAIL.lower()
+        # Checked first only to skip the bcrypt hash when the admin exists;
+        # create_if_absent itself is race-free (parallel test workers).
+        if repo.get_by_email(email) is None:
             admin = User(
-                email=settings.FIRST_ADMIN_EMAIL.lower(),
-                hashed_password=hash_password(settings.FIRST_ADMIN_PASSWORD),
+                email=email,
+                hashed_password=settings.FIRST_ADMIN_PASSWORD_HASH
+                or hash_password(settings.FIRST_ADMIN_PASSWORD, rounds=_TEST_ROUNDS),
                 role=UserRole.ADMIN,
                 full_name="Bootstrap Admin",
             )
-            repo.create(admin)
+            repo.create_if_absent(admin)
+
+
+@pytest.fixture(scope="session")
+def admin_token(ensure_admin_user) -> str:
+    """A bearer token for the bootstrap admin, minted once per run.
+
+    Signed directly rather than obtained from /auth/login, which would pay a
+    bcrypt verify for every test that needs an admin; the login endpoint
+    itself is covered by test_auth.
+    """
+    with get_session() as session:
+        admin = UserRepository(session).get_by_email(settings.FIRST_ADMIN_EMAIL.lower())
+    assert admin is not None, "bootstrap admin was not seeded"
+    return create_access_token(str(admin.id), admin.role, _TOKEN_LIFETIME)
+
+
+def _seed_user(role: str, **fields) -> User:
+    """Store a throwaway user; its credentials are minted, never logged in."""
+    user = User(
+        email=f"{role}_{uuid4().hex[:8]}@test.example",
+        hashed_password=hash_password(uuid4().hex, rounds=_TEST_ROUNDS),
+        role=role,
+        **fields,
+    )
+    with get_session() as session:
+        UserRepository(session).create(user)
+    return user
+
+
+@pytest.fixture(scope="session")
+def regular_user_token(ensure_admin_user) -> str:
+    """A bearer token for a user-role account shared by the whole run."""
+    user = _seed_user(UserRole.USER)
+    return create_access_token(str(user.id), user.role, _TOKEN_LIFETIME)
+
+
+@pytest.fixture(scope="session")
+def service_user_token(ensure_admin_user) -> str:
+    """A bearer token for a (read-only) service account shared by the run."""
+    user = _seed_user(UserRole.SERVICE)
+    return create_access_token(str(user.id), user.role, _TOKEN_LIFETIME)
+
+
+@pytest.fixture(scope="session")
+def api_key(ensure_admin_user) -> str:
+    """A plain API key for a user of its own.
+
+    Not the admin's: POST /auth/api-key replaces the caller's key, so a key
+    held by the admin would be revoked by the tests that generate one.
+    """
+    key = generate_api_key()
+    _seed_user(UserRole.USER, api_key_hash=hash_api_key(key))
+    return key
+
+
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    """One in-process ASGI transport for the whole run.
+
+    It only wraps the app (no sockets or pools), so sharing it is safe across
+    tests and event loops.
+    """
+    return ASGITransport(app=app)
+
+
+@pytest.fixture()
+async def client(asgi_transport: ASGITransport):
+    """Unauthenticated client — use for testing 401 responses.
+
+    A fresh AsyncClient per test keeps header changes from leaking between
+    tests; only the transport is shared.
+    """
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as c:
+        yield c
+
+
+# ---------------------------------------------------------------------------
+# Shared seed graph
+# ---------------------------------------------------------------------------
+# Parents that API tests only hang their own entities off.  Written once per
+# run straight through the repositories (like the admin user above) instead
+# of being re-POSTed by every test.  Tests that update or delete something
+# create that entity themselves, under these parents.
+
+_SEED_PREFIX = "api_test_seed_"
+
+
+@pytest.fixture(scope="session")
+def seed_source() -> str:
+    """ID of a postgresql DataSource shared by the whole run."""
+    source = DataSource(name=f"{_SEED_PREFIX}src", platform=Platform.POSTGRESQL)
+    with get_session() as session:
+        DataSourceRepository(session).create(source)
+    return str(source.id)
+
+
+def _seed_objects(source_id: str, *specs: tuple[str, DataObjectType]) -> list[str]:
+    objects = [
+        DataObject(source_id=source_id, name=f"{_SEED_PREFIX}{name}", object_type=t)
+        for name, t in specs
+    ]
+    with get_session() as session:
+        DataObjectRepository(session).bulk_upsert(objects)
+    return [str(o.id) for o in objects]
+
+
+@pytest.fixture(scope="session")
+def seed_object(seed_source: str) -> str:
+    """ID of a table under seed_source."""
+    return _seed_objects(seed_source, ("tbl", DataObjectType.TABLE))[0]
+
+
+@pytest.fixture(scope="session")
+def seed_two_objects(seed_source: str) -> tuple[str, str]:
+    """IDs of a table and a view under seed_source, not yet linked."""
+    a_id, b_id = _seed_objects(
+        seed_source, ("lin_a", DataObjectType.TABLE), ("lin_b", DataObjectType.VIEW)
+    )
+    return a_id, b_id
@@ -8,44 +8,65 @@ Requires Neo4j to be running (docker compose up -d).
 Skipped automatically when Neo4j is unreachable.
 """
 
+import asyncio
+import json
+import os
+from uuid import uuid4
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from app.core.config import settings
-from app.db.neo4j import verify_connectivity
-from app.main import app
-
-pytestmark = pytest.mark.skipif(
-    not verify_connectivity(),
-    reason="Neo4j is not reachable — start docker compose up -d",
-)
+pytestmark = pytest.mark.neo4j
 
 BASE = "/api/v1"
-_PREFIX = "api_test_"
+# Any well-formed id that no node has, for the 404 tests.
+_MISSING_ID = uuid4()
+# Per pytest-xdist worker, so parallel workers don't collide on names.
+_PREFIX = f"api_test_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}_"
 
 
 @pytest.fixture()
-async def client():
-    """Unauthenticated client — use for testing 401 responses."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+async def auth_client(asgi_transport: ASGITransport, admin_token: str):
+    """Client authenticated as the bootstrap admin."""
+    async with AsyncClient(
+        transport=asgi_transport,
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    ) as c:
         yield c
 
 
-@pytest.fixture()
-async def auth_client():
-    """Client authenticated as the bootstrap admin."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
-        resp = await c.post(
-            f"{BASE}/auth/login",
-            json={
-                "email": settings.FIRST_ADMIN_EMAIL,
-                "password": settings.FIRST_ADMIN_PASSWORD,
-            },
+async def _create_objects(
+    client: AsyncClient, source_id: str, *specs: tuple[str, str]
+) -> list[str]:
+    """POST one object per (object_type, name) spec concurrently; return the ids."""
+    responses = await asyncio.gather(
+        *(
+            client.post(
+                f"{BASE}/objects/",
+                json={
+                    "source_id": source_id,
+                    "object_type": object_type,
+                    "name": f"{_PREFIX}{name}",
+                },
+            )
+            for object_type, name in specs
         )
-        assert resp.status_code == 200, f"Login failed: {resp.text}"
-        token = resp.json()["access_token"]
-        c.headers["Authorization"] = f"Bearer {token}"
-        yield c
+    )
+    return [r.json()["id"] for r in responses]
+
+
+async def _link(client: AsyncClient, *pairs: tuple[str, str]) -> None:
+    """POST a lineage edge per (source, target) pair concurrently."""
+    await asyncio.gather(
+        *(
+            client.post(
+                f"{BASE}/lineage/",
+                json={"source_object_id": src, "target_object_id": tgt},
+            )
+            for src, tgt in pairs
+        )
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -99,8 +120,7 @@ class TestSourcesEndpoints:
         assert resp.json()["id"] == src_id
 
     async def test_get_source_not_found(self, auth_client: AsyncClient):
-        from uuid import uuid4
-        resp = await auth_client.get(f"{BASE}/sources/{uuid4()}")
+        resp = await auth_client.get(f"{BASE}/sources/{_MISSING_ID}")
         assert resp.status_code == 404
         assert "not found" in resp.json()["detail"]
 
@@ -141,9 +161,8 @@ class TestSourcesEndpoints:
         assert resp.json()["description"] == "updated"
 
     async def test_update_source_not_found(self, auth_client: AsyncClient):
-        from uuid import uuid4
         resp = await auth_client.put(
-            f"{BASE}/sources/{uuid4()}",
+            f"{BASE}/sources/{_MISSING_ID}",
             json={"description": "x"},
         )
         assert resp.status_code == 404
@@ -162,8 +181,7 @@ class TestSourcesEndpoints:
         assert resp.status_code == 404
 
     async def test_delete_source_not_found(self, auth_client: AsyncClient):
-        from uuid import uuid4
-        resp = await auth_client.delete(f"{BASE}/sources/{uuid4()}")
+        resp = await auth_client.delete(f"{BASE}/sources/{_MISSING_ID}")
         assert resp.status_code == 404
 
     async def test_create_source_invalid_platform(self, auth_client: AsyncClient):
@@ -193,19 +211,11 @@ class TestSourcesEndpoints:
 
 
 class TestObjectsEndpoints:
-    async def _make_source(self, auth_client: AsyncClient) -> str:
-        r = await auth_client.post(
-            f"{BASE}/sources/",
-            json={"name": f"{_PREFIX}obj_src", "platform": "postgresql"},
-        )
-        return r.json()["id"]
-
-    async def test_create_object(self, auth_client: AsyncClient):
-        src_id = await self._make_source(auth_client)
+    async def test_create_object(self, auth_client: AsyncClient, seed_source: str):
         resp = await auth_client.post(
             f"{BASE}/objects/",
             json={
-                "source_id": src_id,
+                "source_id": seed_source,
                 "object_type": "table",
                 "name": f"{_PREFIX}orders",
                 "schema_name": "public",
@@ -217,36 +227,36 @@ class TestObjectsEndpoints:
         assert "id" in body
 
     async def test_get_object_not_found(self, auth_client: AsyncClient):
-        from uuid import uuid4
-        resp = await auth_client.get(f"{BASE}/objects/{uuid4()}")
+        resp = await auth_client.get(f"{BASE}/objects/{_MISSING_ID}")
         assert resp.status_code == 404
 
-    async def test_list_objects_by_source(self, auth_client: AsyncClient):
-        src_id = await self._make_source(auth_client)
+    async def test_list_objects_by_source(
+        self, auth_client: AsyncClient, seed_source: str
+    ):
         await auth_client.post(
             f"{BASE}/objects/",
-            json={"source_id": src_id, "object_type": "table", "name": f"{_PREFIX}t1"},
+            json={"source_id": seed_source, "object_type": "table", "name": f"{_PREFIX}t1"},
         )
-        resp = await auth_client.get(f"{BASE}/objects/?source_id={src_id}")
+        resp = await auth_client.get(f"{BASE}/objects/?source_id={seed_source}")
         assert resp.status_code == 200
         assert resp.json()["count"] >= 1
 
-    async def test_list_objects_by_type(self, auth_client: AsyncClient):
-        src_id = await self._make_source(auth_client)
+    async def test_list_objects_by_type(
+        self, auth_client: AsyncClient, seed_source: str
+    ):
         await auth_client.post(
             f"{BASE}/objects/",
-            json={"source_id": src_id, "object_type": "dashboard", "name": f"{_PREFIX}dash"},
+            json={"source_id": seed_source, "object_type": "dashboard", "name": f"{_PREFIX}dash"},
         )
         resp = await auth_client.get(f"{BASE}/objects/?object_type=dashboard")
         assert resp.status_code == 200
         for item in resp.json()["items"]:
             assert item["object_type"] == "dashboard"
 
-    async def test_delete_object(self, auth_client: AsyncClient):
-        src_id = await self._make_source(auth_client)
+    async def test_delete_object(self, auth_client: AsyncClient, seed_source: str):
         create = await auth_client.post(
             f"{BASE}/objects/",
-            json={"source_id": src_id, "object_type": "table", "name": f"{_PREFIX}del_obj"},
+            json={"source_id": seed_source, "object_type": "table", "name": f"{_PREFIX}del_obj"},
         )
         obj_id = create.json()["id"]
         assert (await auth_client.delete(f"{BASE}/objects/{obj_id}")).status_code == 204
@@ -259,27 +269,11 @@ class TestObjectsEndpoints:
 
 
 class TestColumnsEndpoints:
-    async def _make_object(self, auth_client: AsyncClient) -> str:
-        src = await auth_client.post(
-            f"{BASE}/sources/",
-            json={"name": f"{_PREFIX}col_src", "platform": "postgresql"},
-        )
-        obj = await auth_client.post(
-            f"{BASE}/objects/",
-            json={
-                "source_id": src.json()["id"],
-                "object_type": "table",
-                "name": f"{_PREFIX}col_tbl",
-            },
-        )
-        return obj.json()["id"]
-
-    async def test_create_column(self, auth_client: AsyncClient):
-        obj_id = await self._make_object(auth_client)
+    async def test_create_column(self, auth_client: AsyncClient, seed_object: str):
         resp = await auth_client.post(
             f"{BASE}/columns/",
             json={
-                "object_id": obj_id,
+                "object_id": seed_object,
                 "name": f"{_PREFIX}order_id",
                 "data_type": "integer",
                 "is_primary_key": True,
@@ -290,21 +284,21 @@ class TestColumnsEndpoints:
         body = resp.json()
         assert body["is_primary_key"] is True
 
-    async def test_list_columns_by_object(self, auth_client: AsyncClient):
-        obj_id = await self._make_object(auth_client)
+    async def test_list_columns_by_object(
+        self, auth_client: AsyncClient, seed_object: str
+    ):
         await auth_client.post(
             f"{BASE}/columns/",
-            json={"object_id": obj_id, "name": f"{_PREFIX}col_a"},
+            json={"object_id": seed_object, "name": f"{_PREFIX}col_a"},
         )
-        resp = await auth_client.get(f"{BASE}/columns/?object_id={obj_id}")
+        resp = await auth_client.get(f"{BASE}/columns/?object_id={seed_object}")
         assert resp.status_code == 200
         assert resp.json()["count"] >= 1
 
-    async def test_update_column(self, auth_client: AsyncClient):
-        obj_id = await self._make_object(auth_client)
+    async def test_update_column(self, auth_client: AsyncClient, seed_object: str):
         create = await auth_client.post(
             f"{BASE}/columns/",
-            json={"object_id": obj_id, "name": f"{_PREFIX}col_upd"},
+            json={"object_id": seed_object, "name": f"{_PREFIX}col_upd"},
         )
         col_id = create.json()["id"]
         resp = await auth_client.put(
@@ -321,24 +315,10 @@ class TestColumnsEndpoints:
 
 
 class TestLineageEndpoints:
-    async def _make_two_objects(self, auth_client: AsyncClient) -> tuple[str, str]:
-        src = await auth_client.post(
-            f"{BASE}/sources/",
-            json={"name": f"{_PREFIX}lin_src", "platform": "postgresql"},
-        )
-        src_id = src.json()["id"]
-        a = await auth_client.post(
-            f"{BASE}/objects/",
-            json={"source_id": src_id, "object_type": "table", "name": f"{_PREFIX}lin_a"},
-        )
-        b = await auth_client.post(
-            f"{BASE}/objects/",
-            json={"source_id": src_id, "object_type": "view", "name": f"{_PREFIX}lin_b"},
-        )
-        return a.json()["id"], b.json()["id"]
-
-    async def test_create_lineage(self, auth_client: AsyncClient):
-        a_id, b_id = await self._make_two_objects(auth_client)
+    async def test_create_lineage(
+        self, auth_client: AsyncClient, seed_two_objects: tuple[str, str]
+    ):
+        a_id, b_id = seed_two_objects
         resp = await auth_client.post(
             f"{BASE}/lineage/",
             json={
@@ -351,8 +331,10 @@ class TestLineageEndpoints:
         body = resp.json()
         assert body["lineage_type"] == "derived"
 
-    async def test_self_reference_rejected(self, auth_client: AsyncClient):
-        a_id, _ = await self._make_two_objects(auth_client)
+    async def test_self_reference_rejected(
+        self, auth_client: AsyncClient, seed_two_objects: tuple[str, str]
+    ):
+        a_id, _ = seed_two_objects
         resp = await auth_client.post(
             f"{BASE}/lineage/",
             json={"source_object_id": a_id, "target_object_id": a_id},
@@ -360,12 +342,13 @@ class TestLineageEndpoints:
         assert resp.status_code == 422
 
     async def test_get_lineage_not_found(self, auth_client: AsyncClient):
-        from uuid import uuid4
-        resp = await auth_client.get(f"{BASE}/lineage/{uuid4()}")
+        resp = await auth_client.get(f"{BASE}/lineage/{_MISSING_ID}")
         assert resp.status_code == 404
 
-    async def test_list_lineage_by_source(self, auth_client: AsyncClient):
-        a_id, b_id = await self._make_two_objects(auth_client)
+    async def test_list_lineage_by_source(
+        self, auth_client: AsyncClient, seed_two_objects: tuple[str, str]
+    ):
+        a_id, b_id = seed_two_objects
         await auth_client.post(
             f"{BASE}/lineage/",
             json={"source_object_id": a_id, "target_object_id": b_id},
@@ -374,8 +357,24 @@ class TestLineageEndpoints:
         assert resp.status_code == 200
         assert resp.json()["count"] >= 1
 
-    async def test_delete_lineage(self, auth_client: AsyncClient):
-        a_id, b_id = await self._make_two_objects(auth_client)
+    async def test_export_lineage_ndjson(
+        self, auth_client: AsyncClient, seed_two_objects: tuple[str, str]
+    ):
+        a_id, b_id = seed_two_objects
+        create = await auth_client.post(
+            f"{BASE}/lineage/",
+            json={"source_object_id": a_id, "target_object_id": b_id},
+        )
+        resp = await auth_client.get(f"{BASE}/lineage/export")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        ids = {json.loads(line)["id"] for line in resp.text.splitlines()}
+        assert create.json()["id"] in ids
+
+    async def test_delete_lineage(
+        self, auth_client: AsyncClient, seed_two_objects: tuple[str, str]
+    ):
+        a_id, b_id = seed_two_objects
         create = await auth_client.post(
             f"{BASE}/lineage/",
             json={"source_object_id": a_id, "target_object_id": b_id},
@@ -384,17 +383,17 @@ class TestLineageEndpoints:
         assert (await auth_client.delete(f"{BASE}/lineage/{lin_id}")).status_code == 204
         assert (await auth_client.get(f"{BASE}/lineage/{lin_id}")).status_code == 404
 
-    async def test_downstream_impact(self, auth_client: AsyncClient):
-        src = await auth_client.post(
-            f"{BASE}/sources/",
-            json={"name": f"{_PREFIX}impact_src", "platform": "postgresql"},
+    async def test_downstream_impact(
+        self, auth_client: AsyncClient, seed_source: str
+    ):
+        a, b, c = await _create_objects(
+            auth_client,
+            seed_source,
+            ("table", "imp_a"),
+            ("view", "imp_b"),
+            ("dashboard", "imp_c"),
         )
-        sid = src.json()["id"]
-        a = (await auth_client.post(f"{BASE}/objects/", json={"source_id": sid, "object_type": "table", "name": f"{_PREFIX}imp_a"})).json()["id"]
-        b = (await auth_client.post(f"{BASE}/objects/", json={"source_id": sid, "object_type": "view", "name": f"{_PREFIX}imp_b"})).json()["id"]
-        c = (await auth_client.post(f"{BASE}/objects/", json={"source_id": sid, "object_type": "dashboard", "name": f"{_PREFIX}imp_c"})).json()["id"]
-        await auth_client.post(f"{BASE}/lineage/", json={"source_object_id": a, "target_object_id": b})
-        await auth_client.post(f"{BASE}/lineage/", json={"source_object_id": b, "target_object_id": c})
+        await _link(auth_client, (a, b), (b, c))
 
         resp = await auth_client.get(f"{BASE}/lineage/impact/{a}/downstream")
         assert resp.status_code == 200
@@ -404,15 +403,11 @@ class TestLineageEndpoints:
         assert b in node_ids
         assert c in node_ids
 
-    async def test_upstream_impact(self, auth_client: AsyncClient):
-        src = await auth_client.post(
-            f"{BASE}/sources/",
-            json={"name": f"{_PREFIX}up_src2", "platform": "postgresql"},
+    async def test_upstream_impact(self, auth_client: AsyncClient, seed_source: str):
+        a, b = await _create_objects(
+            auth_client, seed_source, ("table", "up2_a"), ("view", "up2_b")
         )
-        sid = src.json()["id"]
-        a = (await auth_client.post(f"{BASE}/objects/", json={"source_id": sid, "object_type": "table", "name": f"{_PREFIX}up2_a"})).json()["id"]
-        b = (await auth_client.post(f"{BASE}/objects/", json={"source_id": sid, "object_type": "view", "name": f"{_PREFIX}up2_b"})).json()["id"]
-        await auth_client.post(f"{BASE}/lineage/", json={"source_object_id": a, "target_object_id": b})
+        await _link(auth_client, (a, b))
 
         resp = await auth_client.get(f"{BASE}/lineage/impact/{b}/upstream")
         assert resp.status_code == 200
@@ -13,17 +13,15 @@ Covers:
 Requires Neo4j to be running (docker compose up -d).
 """
 
+import uuid
+
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
 from app.core.config import settings
-from app.db.neo4j import verify_connectivity
-from app.main import app
+from app.core.security import decode_token
 
-pytestmark = pytest.mark.skipif(
-    not verify_connectivity(),
-    reason="Neo4j is not reachable — start docker compose up -d",
-)
+pytestmark = pytest.mark.neo4j
 
 BASE = "/api/v1"
 
@@ -34,23 +32,8 @@ BASE = "/api/v1"
 
 
 @pytest.fixture()
-async def client():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
-        yield c
-
-
-@pytest.fixture()
-async def admin_client(client: AsyncClient):
-    resp = await client.post(
-        f"{BASE}/auth/login",
-        json={
-            "email": settings.FIRST_ADMIN_EMAIL,
-            "password": settings.FIRST_ADMIN_PASSWORD,
-        },
-    )
-    assert resp.status_code == 200, f"Admin login failed: {resp.text}"
-    token = resp.json()["access_token"]
-    client.headers["Authorization"] = f"Bearer {token}"
+def admin_client(client: AsyncClient, admin_token: str) -> AsyncClient:
+    client.headers["Authorization"] = f"Bearer {admin_token}"
     return client
 
 
@@ -117,21 +100,14 @@ class TestTokenRefresh:
         # Token is present and is a valid JWT (decodable)
         assert "access_token" in body
         assert "refresh_token" in body
-        from app.core.security import decode_token
         payload = decode_token(body["access_token"])
         assert payload["type"] == "access"
 
-    async def test_refresh_with_access_token_fails(self, client: AsyncClient):
-        login = await client.post(
-            f"{BASE}/auth/login",
-            json={
-                "email": settings.FIRST_ADMIN_EMAIL,
-                "password": settings.FIRST_ADMIN_PASSWORD,
-            },
-        )
-        access_token = login.json()["access_token"]
+    async def test_refresh_with_access_token_fails(
+        self, client: AsyncClient, admin_token: str
+    ):
         resp = await client.post(
-            f"{BASE}/auth/refresh", json={"refresh_token": access_token}
+            f"{BASE}/auth/refresh", json={"refresh_token": admin_token}
         )
         assert resp.status_code == 401
 
@@ -187,18 +163,7 @@ class TestProtectedRoutes:
 
 
 class TestRbac:
-    async def _create_regular_user(self, admin_client: AsyncClient) -> dict:
-        import uuid
-        email = f"user_{uuid.uuid4().hex[:8]}@test.example"
-        resp = await admin_client.post(
-            f"{BASE}/auth/register",
-            json={"email": email, "password": "test1234!", "role": "user"},
-        )
-        assert resp.status_code == 201, resp.text
-        return {"email": email, "password": "test1234!"}
-
     async def test_admin_can_register_user(self, admin_client: AsyncClient):
-        import uuid
         email = f"newuser_{uuid.uuid4().hex[:8]}@test.example"
         resp = await admin_client.post(
             f"{BASE}/auth/register",
@@ -209,13 +174,11 @@ class TestRbac:
         assert body["role"] == "user"
         assert body["email"] == email.lower()
 
-    async def test_regular_user_cannot_register(self, client: AsyncClient, admin_client: AsyncClient):
-        creds = await self._create_regular_user(admin_client)
-        login = await client.post(f"{BASE}/auth/login", json=creds)
-        user_token = login.json()["access_token"]
-        client.headers["Authorization"] = f"Bearer {user_token}"
+    async def test_regular_user_cannot_register(
+        self, client: AsyncClient, regular_user_token: str
+    ):
+        client.headers["Authorization"] = f"Bearer {regular_user_token}"
 
-        import uuid
         resp = await client.post(
             f"{BASE}/auth/register",
             json={"email": f"another_{uuid.uuid4().hex[:8]}@test.example", "password": "test1234!", "role": "user"},
@@ -223,7 +186,6 @@ class TestRbac:
         assert resp.status_code == 403
 
     async def test_duplicate_email_returns_409(self, admin_client: AsyncClient):
-        import uuid
         email = f"dup_{uuid.uuid4().hex[:8]}@test.example"
         await admin_client.post(
             f"{BASE}/auth/register",
@@ -236,7 +198,6 @@ class TestRbac:
         assert resp.status_code == 409
 
     async def test_invalid_role_returns_422(self, admin_client: AsyncClient):
-        import uuid
         resp = await admin_client.post(
             f"{BASE}/auth/register",
             json={
@@ -261,20 +222,12 @@ class TestApiKeyAuth:
         assert body["api_key"].startswith("lng_")
         assert "note" in body
 
-    async def test_api_key_can_authenticate(self, admin_client: AsyncClient, client: AsyncClient):
-        key_resp = await admin_client.post(f"{BASE}/auth/api-key")
-        api_key = key_resp.json()["api_key"]
-
-        client.headers.pop("Authorization", None)
+    async def test_api_key_can_authenticate(self, client: AsyncClient, api_key: str):
         client.headers["X-API-Key"] = api_key
         resp = await client.get(f"{BASE}/auth/me")
         assert resp.status_code == 200
 
-    async def test_api_key_via_bearer(self, admin_client: AsyncClient, client: AsyncClient):
-        key_resp = await admin_client.post(f"{BASE}/auth/api-key")
-        api_key = key_resp.json()["api_key"]
-
-        client.headers.pop("X-API-Key", None)
+    async def test_api_key_via_bearer(self, client: AsyncClient, api_key: str):
         client.headers["Authorization"] = f"Bearer {api_key}"
         resp = await client.get(f"{BASE}/auth/me")
         assert resp.status_code == 200
@@ -291,33 +244,19 @@ class TestApiKeyAuth:
 
 
 class TestServiceAccount:
-    async def _create_service_user(self, admin_client: AsyncClient, client: AsyncClient) -> AsyncClient:
-        import uuid
-        email = f"svc_{uuid.uuid4().hex[:8]}@test.example"
-        await admin_client.post(
-            f"{BASE}/auth/register",
-            json={"email": email, "password": "svc1234!", "role": "service"},
-        )
-        login = await client.post(
-            f"{BASE}/auth/login",
-            json={"email": email, "password": "svc1234!"},
+    async def test_service_can_read(
+        self, client: AsyncClient, service_user_token: str
+    ):
+        client.headers["Authorization"] = f"Bearer {service_user_token}"
+        resp = await client.get(f"{BASE}/sources/")
+        assert resp.status_code == 200
+
+    async def test_service_cannot_write(
+        self, client: AsyncClient, service_user_token: str
+    ):
+        client.headers["Authorization"] = f"Bearer {service_user_token}"
+        resp = await client.post(
+            f"{BASE}/sources/",
+            json={"name": "svc_write_attempt", "platform": "postgresql"},
         )
-        new_client_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
-        return new_client_headers
-
-    async def test_service_can_read(self, client: AsyncClient, admin_client: AsyncClient):
-        headers = await self._create_service_user(admin_client, client)
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as svc:
-            svc.headers.update(headers)
-            resp = await svc.get(f"{BASE}/sources/")
-            assert resp.status_code == 200
-
-    async def test_service_cannot_write(self, client: AsyncClient, admin_client: AsyncClient):
-        headers = await self._create_service_user(admin_client, client)
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as svc:
-            svc.headers.update(headers)
-            resp = await svc.post(
-                f"{BASE}/sources/",
-                json={"name": "svc_write_attempt", "platform": "postgresql"},
-            )
-            assert resp.status_code == 403
+        assert resp.status_code == 403
@@ -1,7 +1,7 @@
 """Integration tests for the connector API endpoints.
 
 Requires:
-  - The FastAPI app (mocked or live Neo4j) to handle requests
+  - Neo4j, for the app lifespan (skipped when unreachable)
   - lineage-postgres on localhost:5433 for live extract tests
 
 Endpoints under test:
@@ -13,6 +13,7 @@ Endpoints under test:
 
 from __future__ import annotations
 
+import functools
 import os
 
 import pytest
@@ -20,6 +21,9 @@ from fastapi.testclient import TestClient
 
 from app.core.config import settings
 
+# The TestClient runs the app lifespan, which applies the Neo4j constraints.
+pytestmark = pytest.mark.neo4j
+
 # ---------------------------------------------------------------------------
 # Fixtures — reuse from test_api.py pattern
 # ---------------------------------------------------------------------------
@@ -31,7 +35,9 @@ except ImportError:
     _HAS_PSYCOPG2 = False
 
 
+@functools.cache
 def _pg_available() -> bool:
+    """Probe lineage-postgres once per run; every caller reuses the answer."""
     if not _HAS_PSYCOPG2:
         return False
     try:
@@ -54,19 +60,9 @@ def client():
 
 
 @pytest.fixture(scope="module")
-def auth_headers(client):
+def auth_headers(admin_token):
     """Return Bearer token headers for the bootstrap admin user."""
-    resp = client.post(
-        f"{settings.API_V1_STR}/auth/login",
-        json={
-            "email": settings.FIRST_ADMIN_EMAIL,
-            "password": settings.FIRST_ADMIN_PASSWORD,
-        },
-    )
-    if resp.status_code != 200:
-        pytest.skip(f"Cannot authenticate (status {resp.status_code}): {resp.text}")
-    token = resp.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": f"Bearer {admin_token}"}
 
 
 # ---------------------------------------------------------------------------
@@ -13,7 +13,6 @@ Requires a running Neo4j instance (docker compose up -d).
 Skipped automatically when Neo4j is unreachable.
 """
 
-import json
 import os
 import time
 from datetime import datetime, timezone
@@ -29,20 +28,21 @@ from app.db.repositories.data_source import DataSourceRepository
 from app.db.repositories.lineage import LineageRepository
 from app.models.schema import DataObject, DataObjectType, DataSource, Lineage, Platform
 
-pytestmark = pytest.mark.skipif(
-    not verify_connectivity(),
-    reason="Neo4j is not reachable — start docker compose up -d",
-)
+pytestmark = pytest.mark.neo4j
 
-_PERF_PREFIX = "perf_test_"
-_PERF_SCHEMA = "perf_schema"
+# Per pytest-xdist worker, so one worker's cleanup never deletes the nodes
+# another worker is still using.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+_PERF_PREFIX = f"perf_test_{_WORKER}_"
+_PERF_SCHEMA = f"perf_schema_{_WORKER}"
 
 
 @pytest.fixture(scope="module")
 def session():
     """Module-scoped session — shared across all tests in this file."""
+    # Constraints and indexes are applied once per run by the conftest's
+    # ensure_admin_user.
     with get_session() as s:
-        apply_constraints_and_indexes(s)
         yield s
         # Cleanup all performance-test nodes
         s.run(
@@ -87,36 +87,53 @@ class TestConnection:
 
 
 class TestConstraintsAndIndexes:
-    def test_uniqueness_constraints_exist(self, session):
+    @pytest.fixture(scope="class")
+    def schema_names(self, session) -> tuple[set[str], set[str]]:
+        """(constraint names, index names), listed once for the class."""
+        constraints = session.run(
+            "SHOW CONSTRAINTS YIELD name RETURN collect(name) AS names"
+        ).single()["names"]
+        indexes = session.run(
+            "SHOW INDEXES YIELD name RETURN collect(name) AS names"
+        ).single()["names"]
+        return set(constraints), set(indexes)
+
+    def test_uniqueness_constraints_exist(self, schema_names):
         """All four entity uniqueness constraints must be present in Neo4j."""
-        result = session.run("SHOW CONSTRAINTS YIELD name RETURN collect(name) AS names")
-        names: list[str] = result.single()["names"]
-        expected = [
+        names, _ = schema_names
+        expected = {
             "datasource_id_unique",
             "dataobject_id_unique",
             "column_id_unique",
             "lineage_id_unique",
-        ]
-        for constraint in expected:
-            assert constraint in names, f"Missing constraint: {constraint}"
+        }
+        assert not expected - names, f"Missing constraints: {expected - names}"
 
-    def test_indexes_exist(self, session):
+    def test_indexes_exist(self, schema_names):
         """Core lookup indexes must be present."""
-        result = session.run("SHOW INDEXES YIELD name RETURN collect(name) AS names")
-        names: list[str] = result.single()["names"]
-        expected_indexes = [
+        _, names = schema_names
+        expected = {
             "datasource_name",
             "datasource_platform",
             "dataobject_name",
             "dataobject_type",
-        ]
-        for idx in expected_indexes:
-            assert idx in names, f"Missing index: {idx}"
+            "lineage_source_object_id",
+            "lineage_target_object_id",
+        }
+        assert not expected - names, f"Missing indexes: {expected - names}"
 
     def test_apply_constraints_idempotent(self, session):
         """Running apply_constraints_and_indexes twice must not raise."""
         apply_constraints_and_indexes(session)
 
+    def test_apply_constraints_recreates_missing_index(self, session):
+        """Only missing items are created — a dropped index comes back."""
+        session.run("DROP INDEX column_name IF EXISTS")
+        apply_constraints_and_indexes(session)
+        result = session.run("SHOW INDEXES YIELD name RETURN collect(name) AS names")
+        assert "column_name" in result.single()["names"]
+
+
 
 # ---------------------------------------------------------------------------
 # Cypher lineage queries
@@ -124,8 +141,12 @@ class TestConstraintsAndIndexes:
 
 
 class TestLineageQueries:
-    def _seed_chain(self, session):
-        """Create A → B → C and return (A, B, C) DataObjects."""
+    @pytest.fixture(scope="class")
+    def chain(self, session):
+        """Create A → B → C once for the class and return (A, B, C) DataObjects.
+
+        The traversal tests only read the chain, so they can share it.
+        """
         src = DataSource(name=f"{_PERF_PREFIX}chain_src", platform=Platform.POSTGRESQL)
         DataSourceRepository(session).create(src)
         a = DataObject(source_id=src.id, object_type=DataObjectType.TABLE,
@@ -134,17 +155,16 @@ class TestLineageQueries:
                        name=f"{_PERF_PREFIX}chain_b", schema_name=_PERF_SCHEMA)
         c = DataObject(source_id=src.id, object_type=DataObjectType.DASHBOARD,
                        name=f"{_PERF_PREFIX}chain_c", schema_name=_PERF_SCHEMA)
-        obj_repo = DataObjectRepository(session)
-        for o in [a, b, c]:
-            obj_repo.create(o)
-        lin_repo = LineageRepository(session)
-        lin_repo.create(Lineage(source_object_id=a.id, target_object_id=b.id))
-        lin_repo.create(Lineage(source_object_id=b.id, target_object_id=c.id))
+        DataObjectRepository(session).bulk_upsert([a, b, c])
+        LineageRepository(session).bulk_upsert([
+            Lineage(source_object_id=a.id, target_object_id=b.id),
+            Lineage(source_object_id=b.id, target_object_id=c.id),
+        ])
         return a, b, c
 
-    def test_direct_relationship_cypher(self, session):
+    def test_direct_relationship_cypher(self, session, chain):
         """HAS_LINEAGE edge between two nodes is queryable via plain Cypher."""
-        a, b, _ = self._seed_chain(session)
+        a, b, _ = chain
         result = session.run(
             "MATCH (s:DataObject {id: $sid})-[:HAS_LINEAGE]->(t:DataObject {id: $tid}) "
             "RETURN count(*) AS cnt",
@@ -152,9 +172,9 @@ class TestLineageQueries:
         ).single()
         assert result["cnt"] == 1
 
-    def test_multi_hop_downstream_cypher(self, session):
+    def test_multi_hop_downstream_cypher(self, session, chain):
         """Variable-length traversal reaches nodes 2 hops away."""
-        a, _, c = self._seed_chain(session)
+        a, _, c = chain
         result = session.run(
             "MATCH (s:DataObject {id: $sid})-[:HAS_LINEAGE*1..5]->(t:DataObject) "
             "RETURN collect(t.id) AS ids",
@@ -162,9 +182,9 @@ class TestLineageQueries:
         ).single()
         assert str(c.id) in result["ids"]
 
-    def test_multi_hop_upstream_cypher(self, session):
+    def test_multi_hop_upstream_cypher(self, session, chain):
         """Reverse traversal reaches nodes 2 hops upstream."""
-        a, _, c = self._seed_chain(session)
+        a, _, c = chain
         result = session.run(
             "MATCH (s:DataObject)-[:HAS_LINEAGE*1..5]->(t:DataObject {id: $tid}) "
             "RETURN collect(s.id) AS ids",
@@ -208,18 +228,14 @@ class TestLineageQueries:
 
 
 class TestPerformance:
-    _seeded = False
-
-    def _seed_1000_nodes(self, session):
+    @pytest.fixture(scope="module")
+    def seeded_1000(self, session):
         """Bulk-insert 1000 DataObject nodes using UNWIND (runs once per module)."""
-        if TestPerformance._seeded:
-            return
         now = datetime.now(timezone.utc).isoformat()
         source_id = str(uuid4())
         # Create a dummy DataSource node first
         session.run(
-            "MERGE (n:DataSource {id: $id}) SET n += $props",
-            id=source_id,
+            "CREATE (n:DataSource) SET n = $props",
             props={
                 "id": source_id,
                 "name": f"{_PERF_PREFIX}bulk_src",
@@ -230,41 +246,38 @@ class TestPerformance:
                 "extra_metadata": "{}",
             },
         )
+        shared = {
+            "source_id": source_id,
+            "object_type": "table",
+            "schema_name": _PERF_SCHEMA,
+            "database_name": "perf_db",
+            "description": None,
+            "sql_definition": None,
+            "extra_metadata": "{}",
+            "schema_version": "1.1.0",
+            "created_at": now,
+            "updated_at": now,
+        }
         props_list = [
-            {
-                "id": str(uuid4()),
-                "source_id": source_id,
-                "object_type": "table",
-                "name": f"{_PERF_PREFIX}bulk_{i:04d}",
-                "schema_name": _PERF_SCHEMA,
-                "database_name": "perf_db",
-                "description": None,
-                "sql_definition": None,
-                "extra_metadata": json.dumps({}),
-                "schema_version": "1.1.0",
-                "created_at": now,
-                "updated_at": now,
-            }
+            {**shared, "id": str(uuid4()), "name": f"{_PERF_PREFIX}bulk_{i:04d}"}
             for i in range(1000)
         ]
+        # Fresh uuid4 ids, so CREATE: no MERGE match per row.
         session.run(
-            "UNWIND $props AS p MERGE (n:DataObject {id: p.id}) SET n += p",
+            "UNWIND $props AS p CREATE (n:DataObject) SET n = p",
             props=props_list,
         )
-        TestPerformance._seeded = True
 
-    def test_1000_nodes_seeded(self, session):
+    def test_1000_nodes_seeded(self, session, seeded_1000):
         """Verify the 1000 seed nodes are actually in the DB."""
-        self._seed_1000_nodes(session)
         result = session.run(
             "MATCH (n:DataObject {schema_name: $schema}) RETURN count(n) AS cnt",
             schema=_PERF_SCHEMA,
         ).single()
         assert result["cnt"] >= 1000
 
-    def test_count_query_under_100ms(self, session):
+    def test_count_query_under_100ms(self, session, seeded_1000):
         """COUNT query over 1000 indexed nodes must complete in <100ms."""
-        self._seed_1000_nodes(session)
         # Warm-up pass (first query may open a connection)
         session.run(
             "MATCH (n:DataObject {object_type: 'table'}) RETURN count(n) AS cnt"
@@ -278,14 +291,15 @@ class TestPerformance:
         assert result["cnt"] >= 1000
         assert elapsed_ms < 100, f"Query took {elapsed_ms:.1f}ms — expected <100ms"
 
-    def test_name_prefix_scan_under_100ms(self, session):
+    def test_name_prefix_scan_under_100ms(self, session, seeded_1000):
         """Prefix scan over 1000 nodes must complete in <100ms."""
-        self._seed_1000_nodes(session)
+        query = (
+            "MATCH (n:DataObject) WHERE n.name STARTS WITH $prefix RETURN count(n) AS cnt"
+        )
+        # Warm-up pass, so the timed pass reuses the cached plan
+        session.run(query, prefix=_PERF_PREFIX).single()
         start = time.perf_counter()
-        result = session.run(
-            "MATCH (n:DataObject) WHERE n.name STARTS WITH $prefix RETURN count(n) AS cnt",
-            prefix=_PERF_PREFIX,
-        ).single()
+        result = session.run(query, prefix=_PERF_PREFIX).single()
         elapsed_ms = (time.perf_counter() - start) * 1000
         assert result["cnt"] >= 1000
         assert elapsed_ms < 100, f"Prefix scan took {elapsed_ms:.1f}ms — expected <100ms"
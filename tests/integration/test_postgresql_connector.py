@@ -283,14 +283,10 @@ class TestOfflineMode:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.neo4j
 class TestNeo4jPersistence:
     def test_objects_stored_and_retrievable(self, pg_metadata):
         """Verify that extracted objects can be stored and retrieved via Neo4j."""
-        from app.db.neo4j import verify_connectivity
-
-        if not verify_connectivity():
-            pytest.skip("Neo4j not available")
-
         from app.db.neo4j import get_session
         from app.db.repositories.data_object import DataObjectRepository
         from app.db.repositories.data_source import DataSourceRepository
@@ -7,10 +7,13 @@ Each test class uses a dedicated neo4j session that is rolled back / cleaned
 up in the fixture teardown so tests are isolated from one another.
 """
 
+import os
+from uuid import uuid4
+
 import pytest
 
 from app.db.constraints import apply_constraints_and_indexes
-from app.db.neo4j import get_session, verify_connectivity
+from app.db.neo4j import get_session
 from app.db.repositories.column import ColumnRepository
 from app.db.repositories.data_object import DataObjectRepository
 from app.db.repositories.data_source import DataSourceRepository
@@ -30,24 +33,24 @@ from app.models.schema import (
 # Skip entire module when Neo4j is not available
 # ---------------------------------------------------------------------------
 
-pytestmark = pytest.mark.skipif(
-    not verify_connectivity(),
-    reason="Neo4j is not reachable — start docker compose up -d",
-)
+pytestmark = pytest.mark.neo4j
 
 
 # ---------------------------------------------------------------------------
 # Session fixture — cleans up test data after each test
 # ---------------------------------------------------------------------------
 
-_TEST_PREFIX = "test_repo_"
+# Per pytest-xdist worker, so one worker's teardown never deletes the nodes
+# another worker is still using.
+_TEST_PREFIX = f"test_repo_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}_"
 
 
 @pytest.fixture()
 def session():
     """Yield a live Neo4j session; delete all test nodes after the test."""
+    # Constraints and indexes are applied once per run by the conftest's
+    # ensure_admin_user.
     with get_session() as s:
-        apply_constraints_and_indexes(s)
         yield s
         # Tear down: remove nodes whose name starts with the test prefix
         s.run(
@@ -106,6 +109,14 @@ class TestDataSourceRepository:
         assert pg.id in pg_ids
         assert tb.id not in pg_ids
 
+    def test_list_by_platform_accepts_str(self, session):
+        repo = DataSourceRepository(session)
+        pg = DataSource(name=_src_name("plat_str_pg"), platform=Platform.POSTGRESQL)
+        repo.create(pg)
+
+        ids = {s.id for s in repo.list_by_platform("postgresql")}
+        assert pg.id in ids
+
     def test_update(self, session):
         repo = DataSourceRepository(session)
         src = DataSource(name=_src_name("upd"), platform=Platform.MYSQL)
@@ -222,6 +233,22 @@ class TestDataObjectRepository:
         ids = {o.id for o in dashboards}
         assert dash.id in ids
         assert tbl.id not in ids
+        assert {o.id for o in repo.list_by_type("dashboard")} == ids
+
+    def test_get_by_ids(self, session):
+        src = DataSource(name=_src_name("obj_gbi_src"), platform=Platform.POSTGRESQL)
+        DataSourceRepository(session).create(src)
+
+        repo = DataObjectRepository(session)
+        objs = [
+            DataObject(source_id=src.id, object_type=DataObjectType.TABLE, name=_src_name(f"gbi_{i}"))
+            for i in range(3)
+        ]
+        repo.bulk_upsert(objs)
+
+        fetched = repo.get_by_ids([objs[0].id, objs[2].id, uuid4()])
+        assert {o.id for o in fetched} == {objs[0].id, objs[2].id}
+        assert repo.get_by_ids([]) == []
 
     def test_update(self, session):
         src = DataSource(name=_src_name("obj_upd_src"), platform=Platform.POSTGRESQL)
@@ -313,6 +340,23 @@ class TestColumnRepository:
         assert repo.delete(col.id) is True
         assert repo.get_by_id(col.id) is None
 
+    def test_bulk_upsert(self, session):
+        obj = self._make_object(session)
+        repo = ColumnRepository(session)
+        cols = [
+            Column(object_id=obj.id, name=_src_name(f"bulk_{i}"), ordinal_position=i)
+            for i in range(50)
+        ]
+        repo.bulk_upsert(cols)
+
+        fetched = repo.list_by_object(obj.id)
+        assert [c.id for c in fetched] == [c.id for c in cols]
+
+        cols[0].data_type = "text"
+        repo.bulk_upsert(cols[:1])
+        assert repo.get_by_id(cols[0].id).data_type == "text"
+        assert len(repo.list_by_object(obj.id)) == 50
+
 
 # ---------------------------------------------------------------------------
 # Lineage
@@ -376,6 +420,33 @@ class TestLineageRepository:
         assert l2.id in ids
         assert l3.id not in ids
 
+    def test_update_reflected_in_edge_listing(self, session):
+        a, b = self._make_two_objects(session)
+        repo = LineageRepository(session)
+        lin = Lineage(source_object_id=a.id, target_object_id=b.id, description="old")
+        repo.create(lin)
+
+        repo.update(lin.model_copy(update={"description": "new"}))
+
+        (listed,) = repo.list_by_source(a.id)
+        assert listed.id == lin.id
+        assert listed.description == "new"
+        assert repo.list_by_target(b.id)[0].description == "new"
+
+    def test_legacy_edge_falls_back_to_node(self, session):
+        a, b = self._make_two_objects(session)
+        repo = LineageRepository(session)
+        lin = Lineage(source_object_id=a.id, target_object_id=b.id)
+        repo.create(lin)
+        # Strip the edge back to the pre-denormalisation shape
+        session.run(
+            "MATCH ()-[r:HAS_LINEAGE {lineage_id: $id}]->() "
+            "SET r = {lineage_id: $id, lineage_type: r.lineage_type}",
+            id=str(lin.id),
+        )
+
+        assert [l.id for l in repo.list_by_source(a.id)] == [lin.id]
+
     def test_list_by_target(self, session):
         a, b = self._make_two_objects(session)
         src2 = DataSource(name=_src_name("lin_tgt_src"), platform=Platform.TABLEAU)
@@ -410,7 +481,7 @@ class TestLineageRepository:
         lin_repo.create(Lineage(source_object_id=b.id, target_object_id=c.id))
 
         downstream = lin_repo.get_downstream(a.id)
-        downstream_ids = {d["props"]["id"] for d in downstream}
+        downstream_ids = {d["id"] for d in downstream}
         assert str(b.id) in downstream_ids
         assert str(c.id) in downstream_ids
 
@@ -430,10 +501,104 @@ class TestLineageRepository:
         lin_repo.create(Lineage(source_object_id=b.id, target_object_id=c.id))
 
         upstream = lin_repo.get_upstream(c.id)
-        upstream_ids = {u["props"]["id"] for u in upstream}
+        upstream_ids = {u["id"] for u in upstream}
         assert str(a.id) in upstream_ids
         assert str(b.id) in upstream_ids
 
+    def test_downstream_diamond_returns_each_node_once(self, session):
+        """A → B → D and A → C → D: D appears once, at its shortest depth."""
+        src = DataSource(name=_src_name("dia_src"), platform=Platform.POSTGRESQL)
+        DataSourceRepository(session).create(src)
+        a, b, c, d = (
+            DataObject(source_id=src.id, object_type=DataObjectType.TABLE, name=_src_name(f"dia_{n}"))
+            for n in "abcd"
+        )
+        DataObjectRepository(session).bulk_upsert([a, b, c, d])
+
+        lin_repo = LineageRepository(session)
+        for s_, t_ in [(a, b), (a, c), (b, d), (c, d)]:
+            lin_repo.create(Lineage(source_object_id=s_.id, target_object_id=t_.id))
+
+        downstream = lin_repo.get_downstream(a.id)
+        depths = {row["id"]: row["depth"] for row in downstream}
+        assert len(downstream) == 3
+        assert depths == {str(b.id): 1, str(c.id): 1, str(d.id): 2}
+
+    def test_upstream_diamond_returns_each_node_once(self, session):
+        """A → B → D and A → C → D: upstream of D lists A once, at depth 2."""
+        src = DataSource(name=_src_name("udia_src"), platform=Platform.POSTGRESQL)
+        DataSourceRepository(session).create(src)
+        a, b, c, d = (
+            DataObject(source_id=src.id, object_type=DataObjectType.TABLE, name=_src_name(f"udia_{n}"))
+            for n in "abcd"
+        )
+        DataObjectRepository(session).bulk_upsert([a, b, c, d])
+        LineageRepository(session).bulk_upsert([
+            Lineage(source_object_id=s_.id, target_object_id=t_.id)
+            for s_, t_ in [(a, b), (a, c), (b, d), (c, d)]
+        ])
+
+        upstream = LineageRepository(session).get_upstream(d.id)
+        ids = [row["id"] for row in upstream]
+        assert len(ids) == len(set(ids)) == 3
+        assert {row["id"]: row["depth"] for row in upstream}[str(a.id)] == 2
+
+    def test_downstream_paging_follows_depth_order(self, session):
+        src = DataSource(name=_src_name("page_src"), platform=Platform.POSTGRESQL)
+        DataSourceRepository(session).create(src)
+        a, b, c, d = (
+            DataObject(source_id=src.id, object_type=DataObjectType.TABLE, name=_src_name(f"page_{n}"))
+            for n in "abcd"
+        )
+        DataObjectRepository(session).bulk_upsert([a, b, c, d])
+        lin_repo = LineageRepository(session)
+        lin_repo.bulk_upsert([
+            Lineage(source_object_id=a.id, target_object_id=b.id),
+            Lineage(source_object_id=a.id, target_object_id=c.id),
+            Lineage(source_object_id=b.id, target_object_id=d.id),
+        ])
+
+        first = lin_repo.get_downstream(a.id, limit=2)
+        second = lin_repo.get_downstream(a.id, limit=2, offset=2)
+        assert [row["depth"] for row in first] == [1, 1]
+        assert [(row["id"], row["depth"]) for row in second] == [(str(d.id), 2)]
+
+    def test_downstream_respects_max_depth(self, session):
+        src = DataSource(name=_src_name("depth_src"), platform=Platform.POSTGRESQL)
+        DataSourceRepository(session).create(src)
+        a, b, c = (
+            DataObject(source_id=src.id, object_type=DataObjectType.TABLE, name=_src_name(f"depth_{n}"))
+            for n in "abc"
+        )
+        DataObjectRepository(session).bulk_upsert([a, b, c])
+        lin_repo = LineageRepository(session)
+        lin_repo.create(Lineage(source_object_id=a.id, target_object_id=b.id))
+        lin_repo.create(Lineage(source_object_id=b.id, target_object_id=c.id))
+
+        ids = {row["id"] for row in lin_repo.get_downstream(a.id, max_depth=1)}
+        assert ids == {str(b.id)}
+
+    def test_bulk_upsert_creates_edges(self, session):
+        src = DataSource(name=_src_name("lin_bulk_src"), platform=Platform.POSTGRESQL)
+        DataSourceRepository(session).create(src)
+        a, b, c = (
+            DataObject(source_id=src.id, object_type=DataObjectType.TABLE, name=_src_name(f"bulk_{n}"))
+            for n in "abc"
+        )
+        DataObjectRepository(session).bulk_upsert([a, b, c])
+
+        lin_repo = LineageRepository(session)
+        edges = [
+            Lineage(source_object_id=a.id, target_object_id=b.id),
+            Lineage(source_object_id=b.id, target_object_id=c.id),
+        ]
+        assert lin_repo.bulk_upsert(edges) == edges
+        assert lin_repo.bulk_upsert([]) == []
+
+        assert {lin.id for lin in lin_repo.list_by_source(a.id)} == {edges[0].id}
+        ids = {row["id"] for row in lin_repo.get_downstream(a.id)}
+        assert ids == {str(b.id), str(c.id)}
+
     def test_column_mappings_round_trip(self, session):
         a, b = self._make_two_objects(session)
         col_repo = ColumnRepository(session)
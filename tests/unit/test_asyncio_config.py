@@ -0,0 +1,18 @@
+"""Checks for the pytest-asyncio settings in pyproject.toml.
+
+Fixtures and tests run on one session-scoped event loop, so a
+session-scoped async fixture can be used from any test.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+async def session_loop():
+    return asyncio.get_running_loop()
+
+
+async def test_async_tests_share_the_session_event_loop(session_loop):
+    assert asyncio.get_running_loop() is session_loop
@@ -0,0 +1,81 @@
+"""Unit tests for BaseRepository serialisation helpers.
+
+No DB required — _to_neo4j / _from_record are pure functions.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import orjson
+
+from app.db.base_repository import BaseRepository
+from app.models.schema import (
+    ColumnLineageMap,
+    DataSource,
+    Lineage,
+    Platform,
+)
+
+
+class TestNeo4jSerialisation:
+    def test_extra_metadata_round_trip(self):
+        src = DataSource(
+            name="pg",
+            platform=Platform.POSTGRESQL,
+            extra_metadata={"encoding": "UTF8", "nested": {"a": [1, 2, 3]}},
+        )
+        props = BaseRepository._to_neo4j(src)
+        assert isinstance(props["extra_metadata"], str)
+        restored = DataSource.model_validate(BaseRepository._from_record(props))
+        assert restored.extra_metadata == src.extra_metadata
+
+    def test_scalar_types_flattened(self):
+        src = DataSource(name="pg", platform=Platform.POSTGRESQL)
+        props = BaseRepository._to_neo4j(src)
+        assert props["id"] == str(src.id)
+        assert props["platform"] == "postgresql"
+        assert datetime.fromisoformat(props["created_at"]) == src.created_at
+
+    def test_non_str_keys_are_coerced(self):
+        props = BaseRepository._flatten({"extra_metadata": {1: "one"}})
+        assert BaseRepository._from_record(props)["extra_metadata"] == {"1": "one"}
+
+    def test_column_mappings_round_trip(self):
+        mapping = ColumnLineageMap(
+            source_column_id=uuid4(), target_column_id=uuid4(), transformation="UPPER(x)"
+        )
+        lin = Lineage(
+            source_object_id=uuid4(), target_object_id=uuid4(), column_mappings=[mapping]
+        )
+        props = BaseRepository._to_neo4j(lin)
+        assert isinstance(props["column_mappings"], str)
+        restored = Lineage.model_validate(BaseRepository._from_record(props))
+        assert restored.column_mappings == [mapping]
+
+    def test_column_mappings_encoded_by_orjson(self):
+        mapping = ColumnLineageMap(source_column_id=uuid4(), target_column_id=uuid4())
+        lin = Lineage(
+            source_object_id=uuid4(), target_object_id=uuid4(), column_mappings=[mapping]
+        )
+        props = BaseRepository._to_neo4j(lin)
+        expected = orjson.dumps([mapping.model_dump(mode="json")]).decode()
+        assert props["column_mappings"] == expected
+
+    def test_primitive_list_stored_natively(self):
+        props = BaseRepository._flatten({"tags": ["finance", "pii"]})
+        assert props["tags"] == ["finance", "pii"]
+        assert BaseRepository._from_record(props)["tags"] == ["finance", "pii"]
+
+    def test_mixed_list_json_encoded(self):
+        props = BaseRepository._flatten({"tags": ["a", 1]})
+        assert props["tags"] == '["a","1"]'
+
+    def test_empty_column_mappings_round_trip(self):
+        lin = Lineage(source_object_id=uuid4(), target_object_id=uuid4())
+        props = BaseRepository._to_neo4j(lin)
+        restored = Lineage.model_validate(BaseRepository._from_record(props))
+        assert restored.column_mappings == []
+
+    def test_invalid_json_left_as_string(self):
+        result = BaseRepository._from_record({"extra_metadata": "not json"})
+        assert result["extra_metadata"] == "not json"
@@ -0,0 +1,103 @@
+"""Unit tests for the Redis-backed lineage traversal cache.
+
+Redis is replaced with an in-memory stub; no server is required.
+"""
+
+import pytest
+import redis as redis_lib
+
+from app.core.config import settings
+from app.db import cache as cache_mod
+
+
+class _StubRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.fail = False
+
+    def _check(self) -> None:
+        if self.fail:
+            raise redis_lib.ConnectionError("unreachable")
+
+    def get(self, key: str) -> bytes | None:
+        self._check()
+        return self.store.get(key)
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self._check()
+        self.store[key] = value
+
+    def incr(self, key: str) -> int:
+        self._check()
+        value = int(self.store.get(key, b"0")) + 1
+        self.store[key] = str(value).encode()
+        return value
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture()
+def stub_redis(monkeypatch):
+    client = _StubRedis()
+    monkeypatch.setattr(cache_mod, "_client", client)
+    monkeypatch.setattr(cache_mod, "_down_until", 0.0)
+    monkeypatch.setattr(settings, "LINEAGE_CACHE_TTL_S", 60)
+    return client
+
+
+class _Counter:
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self) -> list[dict]:
+        self.calls += 1
+        return self.rows
+
+
+class TestCachedTraversal:
+    def test_second_call_is_served_from_cache(self, stub_redis):
+        compute = _Counter([{"id": "b", "depth": 1}])
+        first = cache_mod.cached_traversal("down", "a", 3, compute)
+        second = cache_mod.cached_traversal("down", "a", 3, compute)
+        assert first == second == [{"id": "b", "depth": 1}]
+        assert compute.calls == 1
+
+    def test_key_includes_direction_depth_and_page(self, stub_redis):
+        compute = _Counter([])
+        cache_mod.cached_traversal("down", "a", 3, compute)
+        cache_mod.cached_traversal("up", "a", 3, compute)
+        cache_mod.cached_traversal("down", "a", 4, compute)
+        cache_mod.cached_traversal("down", "a", 4, compute, limit=10, offset=10)
+        assert compute.calls == 4
+
+    def test_invalidate_orphans_cached_results(self, stub_redis):
+        compute = _Counter([{"id": "b"}])
+        cache_mod.cached_traversal("down", "a", 3, compute)
+        cache_mod.invalidate_lineage()
+        cache_mod.cached_traversal("down", "a", 3, compute)
+        assert compute.calls == 2
+
+    def test_redis_failure_falls_through_and_backs_off(self, stub_redis):
+        stub_redis.fail = True
+        compute = _Counter([{"id": "b"}])
+        assert cache_mod.cached_traversal("down", "a", 3, compute) == [{"id": "b"}]
+        assert cache_mod.get_redis() is None
+
+    def test_zero_ttl_disables_cache(self, stub_redis, monkeypatch):
+        monkeypatch.setattr(settings, "LINEAGE_CACHE_TTL_S", 0)
+        compute = _Counter([])
+        cache_mod.cached_traversal("down", "a", 3, compute)
+        cache_mod.cached_traversal("down", "a", 3, compute)
+        assert compute.calls == 2
+        assert stub_redis.store == {}
+
+
+class TestSharedClient:
+    def test_client_is_created_once(self, monkeypatch):
+        monkeypatch.setattr(cache_mod, "_client", None)
+        first = cache_mod.get_client()
+        assert cache_mod.get_client() is first
+        cache_mod.close_redis()
+        assert cache_mod._client is None
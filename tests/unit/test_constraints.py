@@ -0,0 +1,71 @@
+"""Unit tests for the schema bootstrap in app.db.constraints.
+
+The session is replaced with a stub that record the
+statements run, so no running Neo4j is required.
+"""
+
+from app.db import constraints
+from app.db.constraints import apply_constraints_and_indexes
+
+_ALL_NAMES = [
+    constraints._schema_name(s) for s in constraints._CONSTRAINTS + constraints._INDEXES
+]
+
+
+class _Result:
+    def __init__(self, names: list[str] | None = None) -> None:
+        self._names = names
+
+    def single(self) -> dict:
+        return {"names": self._names}
+
+    def consume(self) -> None:
+        pass
+
+
+class _StubTx:
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    def run(self, statement: str) -> _Result:
+        self._log.append(statement)
+        return _Result()
+
+
+class _StubSession:
+    def __init__(self, existing: list[str]) -> None:
+        self.existing = existing
+        self.ddl: list[str] = []
+        self.write_calls = 0
+
+    def run(self, statement: str) -> _Result:
+        assert statement == constraints._SHOW_INDEX_NAMES
+        return _Result(self.existing)
+
+    def execute_write(self, work, *args):
+        self.write_calls += 1
+        return work(_StubTx(self.ddl), *args)
+
+
+def _apply(existing: list[str]) -> _StubSession:
+    session = _StubSession(existing)
+    apply_constraints_and_indexes(session)
+    return session
+
+
+class TestApplyConstraints:
+    def test_fresh_database_creates_everything_in_one_write(self):
+        session = _apply([])
+        assert session.write_calls == 1
+        assert session.ddl == constraints._CONSTRAINTS + constraints._INDEXES
+
+    def test_initialised_database_runs_no_ddl(self):
+        session = _apply(_ALL_NAMES)
+        assert session.write_calls == 0
+        assert session.ddl == []
+
+    def test_only_missing_items_are_created(self):
+        existing = [n for n in _ALL_NAMES if n != "column_name"]
+        session = _apply(existing)
+        assert session.write_calls == 1
+        assert [constraints._schema_name(s) for s in session.ddl] == ["column_name"]
@@ -0,0 +1,68 @@
+"""Unit tests for the /health response cache.
+
+The Neo4j and Redis probes are replaced with counters, so no services are
+required.
+"""
+
+import pytest
+
+from app import main as main_mod
+from app.core.config import settings
+
+
+class _Probes:
+    def __init__(self) -> None:
+        self.calls = {"neo4j": 0, "redis": 0}
+        self.neo4j_up = True
+
+    def neo4j_status(self) -> dict:
+        self.calls["neo4j"] += 1
+        return {"connected": self.neo4j_up}
+
+    def redis_status(self) -> dict:
+        self.calls["redis"] += 1
+        return {"connected": True}
+
+
+@pytest.fixture()
+def probes(monkeypatch):
+    p = _Probes()
+    monkeypatch.setattr(main_mod, "get_db_status", p.neo4j_status)
+    monkeypatch.setattr(main_mod, "_redis_status", p.redis_status)
+    monkeypatch.setattr(main_mod, "_last_health", None)
+    return p
+
+
+class TestHealthCache:
+    async def test_repeat_probe_is_served_from_cache(self, probes, monkeypatch):
+        monkeypatch.setattr(settings, "HEALTH_CACHE_TTL_S", 60.0)
+        first = await main_mod.health_check()
+        second = await main_mod.health_check()
+        assert first == second
+        assert first["status"] == "ok"
+        assert probes.calls == {"neo4j": 1, "redis": 1}
+
+    async def test_zero_ttl_always_reprobes(self, probes, monkeypatch):
+        monkeypatch.setattr(settings, "HEALTH_CACHE_TTL_S", 0.0)
+        await main_mod.health_check()
+        await main_mod.health_check()
+        assert probes.calls == {"neo4j": 2, "redis": 2}
+
+    async def test_entry_expires_after_ttl(self, probes, monkeypatch):
+        monkeypatch.setattr(settings, "HEALTH_CACHE_TTL_S", 60.0)
+        await main_mod.health_check()
+        computed_at, body = main_mod._last_health
+        main_mod._last_health = (computed_at - 59.0, body)
+        await main_mod.health_check()
+        assert probes.calls["neo4j"] == 1
+        main_mod._last_health = (computed_at - 60.0, body)
+        await main_mod.health_check()
+        assert probes.calls["neo4j"] == 2
+
+    async def test_degraded_response_is_not_cached(self, probes, monkeypatch):
+        monkeypatch.setattr(settings, "HEALTH_CACHE_TTL_S", 60.0)
+        probes.neo4j_up = False
+        assert (await main_mod.health_check())["status"] == "degraded"
+        probes.neo4j_up = True
+        assert (await main_mod.health_check())["status"] == "ok"
+        assert probes.calls == {"neo4j": 2, "redis": 2}
@@ -0,0 +1,144 @@
+"""Unit tests for LineageRepository traversal queries.
+
+A recording session stands in for Neo4j, so these only check what is sent
+over the wire — traversal semantics are covered in tests/integration.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.db.base_repository import BaseRepository
+from app.db.repositories.lineage import LineageRepository
+from app.models.schema import ColumnLineageMap, Lineage
+
+
+@pytest.fixture(autouse=True)
+def _no_traversal_cache(monkeypatch):
+    monkeypatch.setattr(settings, "LINEAGE_CACHE_TTL_S", 0)
+
+
+class _StubResult:
+    def __init__(self, records: list[dict]) -> None:
+        self._records = records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def value(self, key: str) -> list:
+        return [r[key] for r in self._records]
+
+    def data(self) -> list[dict]:
+        return [dict(r) for r in self._records]
+
+
+class _RecordingSession:
+    """Session and managed transaction in one: records every query it runs."""
+
+    def __init__(self, records: list[dict] | None = None) -> None:
+        self.calls: list[tuple[str, dict]] = []
+        self.access_modes: list[str] = []
+        self.records = records or []
+
+    def run(self, query: str, parameters: dict | None = None, **params):
+        self.calls.append((query, {**(parameters or {}), **params}))
+        return _StubResult(self.records)
+
+    def execute_read(self, work, *args):
+        self.access_modes.append("READ")
+        return work(self, *args)
+
+    def execute_write(self, work, *args):
+        self.access_modes.append("WRITE")
+        return work(self, *args)
+
+
+class TestTraversalPlanCaching:
+    def test_max_depth_is_a_parameter(self):
+        session = _RecordingSession()
+        repo = LineageRepository(session)
+        repo.get_downstream(uuid4(), max_depth=3)
+        repo.get_downstream(uuid4(), max_depth=7)
+
+        (q1, p1), (q2, p2) = session.calls
+        assert q1 == q2
+        assert "$max_depth" in q1
+        assert (p1["max_depth"], p2["max_depth"]) == (3, 7)
+
+    def test_upstream_and_downstream_differ_only_in_direction(self):
+        session = _RecordingSession()
+        repo = LineageRepository(session)
+        repo.get_downstream(uuid4(), max_depth=2)
+        repo.get_upstream(uuid4(), max_depth=2)
+
+        down, up = (q for q, _ in session.calls)
+        assert "HAS_LINEAGE>" in down
+        assert "<HAS_LINEAGE" in up
+        assert down.replace("HAS_LINEAGE>", "<HAS_LINEAGE") == up
+
+
+class TestBatchValidation:
+    def test_list_all_decodes_and_validates_every_row(self):
+        lineages = [
+            Lineage(
+                source_object_id=uuid4(),
+                target_object_id=uuid4(),
+                column_mappings=[ColumnLineageMap(source_column_id=uuid4(), target_column_id=uuid4())],
+            )
+            for _ in range(3)
+        ]
+        records = [{"props": BaseRepository._to_neo4j(lin)} for lin in lineages]
+        result = LineageRepository(_RecordingSession(records)).list_all()
+
+        assert result == lineages
+        assert all(isinstance(lin, Lineage) for lin in result)
+
+    def test_iter_all_is_lazy(self):
+        lin = Lineage(source_object_id=uuid4(), target_object_id=uuid4())
+        session = _RecordingSession([{"props": BaseRepository._to_neo4j(lin)}])
+        it = LineageRepository(session).iter_all()
+        assert session.calls == []
+        assert list(it) == [lin]
+
+
+class TestBulkUpsert:
+    def test_batch_is_one_unwind_statement(self):
+        session = _RecordingSession()
+        edges = [Lineage(source_object_id=uuid4(), target_object_id=uuid4()) for _ in range(3)]
+        LineageRepository(session).bulk_upsert(edges)
+
+        ((query, params),) = session.calls
+        assert query.lstrip().startswith("UNWIND $rows")
+        assert [row["id"] for row in params["rows"]] == [str(e.id) for e in edges]
+
+    def test_empty_batch_sends_nothing(self):
+        session = _RecordingSession()
+        LineageRepository(session).bulk_upsert([])
+        assert session.calls == []
+
+
+class TestManagedTransactions:
+    def test_reads_and_writes_use_matching_access_mode(self):
+        session = _RecordingSession()
+        repo = LineageRepository(session)
+        repo.list_all()
+        repo.get_downstream(uuid4())
+        repo.bulk_upsert([Lineage(source_object_id=uuid4(), target_object_id=uuid4())])
+        repo.delete(uuid4())
+        assert session.access_modes == ["READ", "READ", "WRITE", "WRITE"]
+
+
+class TestTraversalPaging:
+    def test_unpaged_traversal_is_uncapped(self):
+        session = _RecordingSession()
+        LineageRepository(session).get_downstream(uuid4())
+        ((query, params),) = session.calls
+        assert "ORDER BY" not in query
+        assert (params["expand_limit"], params["offset"]) == (-1, 0)
+
+    def test_page_caps_expansion_at_offset_plus_limit(self):
+        session = _RecordingSession()
+        LineageRepository(session).get_upstream(uuid4(), limit=20, offset=40)
+        ((_, params),) = session.calls
+        assert (params["expand_limit"], params["offset"]) == (60, 40)
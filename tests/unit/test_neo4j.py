@@ -0,0 +1,87 @@
+"""Unit tests for the connectivity cache and sessions in app.db.neo4j.
+
+The driver is replaced with a stub so no running Neo4j is required.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.dependencies import DbSession
+from app.db import neo4j as neo4j_mod
+
+
+class _StubSession:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _StubDriver:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls = 0
+        self.sessions: list[_StubSession] = []
+
+    def session(self) -> _StubSession:
+        s = _StubSession()
+        self.sessions.append(s)
+        return s
+
+    def verify_connectivity(self) -> None:
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("unreachable")
+
+
+@pytest.fixture()
+def stub_driver(monkeypatch):
+    driver = _StubDriver()
+    monkeypatch.setattr(neo4j_mod, "get_driver", lambda: driver)
+    neo4j_mod.reset_health_cache()
+    yield driver
+    neo4j_mod.reset_health_cache()
+
+
+class TestHealthCache:
+    def test_success_is_cached(self, stub_driver):
+        assert neo4j_mod.verify_connectivity() is True
+        assert neo4j_mod.get_db_status()["connected"] is True
+        assert stub_driver.calls == 1
+
+    def test_failure_is_not_cached(self, stub_driver):
+        stub_driver.fail = True
+        assert neo4j_mod.verify_connectivity() is False
+        status = neo4j_mod.get_db_status()
+        assert status["connected"] is False
+        assert "unreachable" in status["error"]
+        assert stub_driver.calls == 2
+
+    def test_reset_forces_fresh_probe(self, stub_driver):
+        neo4j_mod.verify_connectivity()
+        neo4j_mod.reset_health_cache()
+        neo4j_mod.verify_connectivity()
+        assert stub_driver.calls == 2
+
+    def test_expired_entry_reprobes(self, stub_driver, monkeypatch):
+        monkeypatch.setattr(neo4j_mod.settings, "NEO4J_HEALTH_CACHE_TTL_S", 0.0)
+        neo4j_mod.verify_connectivity()
+        neo4j_mod.verify_connectivity()
+        assert stub_driver.calls == 2
+
+
+class TestRequestSession:
+    def test_db_session_is_closed_after_request(self, stub_driver):
+        app = FastAPI()
+
+        @app.get("/probe")
+        def probe(session: DbSession) -> dict:
+            return {"open": not session.closed}
+
+        with TestClient(app) as client:
+            resp = client.get("/probe")
+        assert resp.status_code == 200
+        assert resp.json() == {"open": True}
+        assert [s.closed for s in stub_driver.sessions] == [True]
@@ -6,11 +6,13 @@ Covers:
   - Optional / nullable fields default correctly
   - qualified_name computation on DataObject
   - Lineage self-reference guard (source != target)
-  - JSON schema validation helpers (valid and invalid metadata)
+  - JSON schema validation helpers (valid and invalid metadata, compiled
+    validators reused on the hot path)
   - Schema version constant is accessible and correctly formatted
   - Round-trip serialisation (model → dict → model)
 """
 
+import json
 from uuid import UUID, uuid4
 
 import pytest
@@ -25,10 +27,17 @@ from app.models import (
     DataSource,
     Lineage,
     LineageType,
+    PLATFORM_METADATA_SCHEMAS,
     Platform,
     get_object_type_schema,
+    get_object_type_validator,
     get_platform_schema,
+    get_platform_validator,
     validate_metadata,
+    validate_metadata_batch,
+    validate_metadata_batch_first_error,
+    validate_object_type_metadata,
+    validate_platform_metadata,
 )
 
 
@@ -383,6 +392,14 @@ class TestMetadataValidation:
         errors = validate_metadata({}, schema)
         assert errors == []
 
+    def test_missing_metadata_is_valid_for_registry_schemas(self):
+        assert validate_platform_metadata(None, "postgresql") == []  # type: ignore[arg-type]
+        assert validate_object_type_metadata({}, "metric") == []
+
+    def test_empty_metadata_checked_when_schema_requires_keys(self):
+        schema = {"type": "object", "required": ["n"]}
+        assert validate_metadata({}, schema)
+
     def test_get_platform_schema_unknown_returns_none(self):
         assert get_platform_schema("nonexistent_platform") is None
 
@@ -461,6 +478,111 @@ class TestMetadataValidation:
         )
         assert errors == []
 
+    def test_validate_platform_metadata_by_name(self):
+        assert validate_platform_metadata({"ssl_mode": "require"}, "PostgreSQL") == []
+        assert validate_platform_metadata({"ssl_mode": "nope"}, "postgresql")
+
+    def test_validate_object_type_metadata_by_name(self):
+        assert validate_object_type_metadata({"row_count": -1}, "table")
+
+    def test_unknown_platform_or_type_passes(self):
+        assert validate_platform_metadata({"anything": 1}, "nonexistent") == []
+        assert validate_object_type_metadata({"anything": 1}, "nonexistent") == []
+
+    def test_ad_hoc_schema_dict_still_supported(self):
+        schema = {"type": "object", "properties": {"n": {"type": "integer"}}}
+        assert validate_metadata({"n": 1}, schema) == []
+        assert validate_metadata({"n": "x"}, schema)
+
+    def test_ad_hoc_schema_compiled_once(self, monkeypatch):
+        from app.models import validators
+
+        calls = []
+        compile_ = validators.fastjsonschema.compile
+        monkeypatch.setattr(
+            validators.fastjsonschema,
+            "compile",
+            lambda schema: calls.append(schema) or compile_(schema),
+        )
+        schema = {"type": "object", "properties": {"adhoc_once": {"type": "integer"}}}
+        assert validate_metadata({"adhoc_once": 1}, schema) == []
+        assert validate_metadata({"adhoc_once": "x"}, dict(schema))
+        assert len(calls) == 1
+
+    def test_invalid_schema_reported(self):
+        errors = validate_metadata({}, {"type": "not-a-type"})
+        assert errors and errors[0].startswith("Invalid schema definition")
+
+    def test_batch_returns_errors_per_item(self):
+        schema = get_object_type_schema("table")
+        items = [{"row_count": 1}, {"row_count": -1}, {}]
+        errors = validate_metadata_batch(items, schema)  # type: ignore[arg-type]
+        assert errors[0] == [] and errors[1] and errors[2] == []
+
+    def test_batch_first_error(self):
+        schema = get_object_type_schema("table")
+        items = [{"row_count": 1}, {"row_count": -1}, {"row_count": "x"}]
+        index, errors = validate_metadata_batch_first_error(items, schema)  # type: ignore[arg-type,misc]
+        assert index == 1 and errors
+        assert validate_metadata_batch_first_error([{}], schema) is None  # type: ignore[arg-type]
+
+    def test_registry_schemas_are_json_serialisable(self):
+        schema = get_platform_schema("postgresql")
+        assert schema is not None
+        assert json.loads(json.dumps(schema)) == PLATFORM_METADATA_SCHEMAS["postgresql"]
+        assert isinstance(schema["properties"]["ssl_mode"]["enum"], list)
+
+    def test_editing_registry_schema_leaves_validation_unchanged(self, monkeypatch):
+        schema = get_platform_schema("postgresql")
+        assert schema is PLATFORM_METADATA_SCHEMAS["postgresql"]
+        monkeypatch.setitem(schema["properties"]["ssl_mode"], "type", "integer")
+        assert validate_platform_metadata({"ssl_mode": "require"}, "postgresql") == []
+        assert validate_metadata({"ssl_mode": "require"}, schema) == []
+
+    def test_schema_derived_from_registry_compiles(self):
+        schema = get_object_type_schema("model")
+        assert schema is not None
+        derived = {**schema, "required": ["materialization"]}
+        assert validate_metadata({"materialization": "view"}, derived) == []
+        assert validate_metadata({"materialization": "streaming"}, derived)
+
+    def test_compiled_validator_accepted(self):
+        validator = get_platform_validator("postgresql")
+        assert validator is not None
+        assert validate_metadata({"ssl_mode": "require"}, validator) == []
+        assert validate_metadata({"ssl_mode": "nope"}, validator)
+
+    def test_validator_lookup_accepts_enum_members(self):
+        assert get_platform_validator(Platform.POSTGRESQL) is get_platform_validator(
+            "postgresql"
+        )
+        assert get_object_type_validator(DataObjectType.TABLE) is not None
+        assert validate_platform_metadata({"ssl_mode": "nope"}, Platform.POSTGRESQL)
+        assert get_platform_validator(Platform.MYSQL) is None
+
+    def test_schema_lookup_is_memoised_per_name(self):
+        get_platform_schema.cache_clear()
+        schema = get_platform_schema("PostgreSQL")
+        assert schema is PLATFORM_METADATA_SCHEMAS["postgresql"]
+        assert get_platform_schema("PostgreSQL") is schema
+        assert get_platform_schema.cache_info().hits == 1
+
+    def test_get_validator_unknown_returns_none(self):
+        assert get_platform_validator("nonexistent_platform") is None
+        assert get_object_type_validator("nonexistent_type") is None
+
+    def test_registry_schema_not_recompiled(self, monkeypatch):
+        from app.models import validators
+
+        def _fail(schema):
+            raise AssertionError("registry schema recompiled")
+
+        schema = get_object_type_schema("table")
+        validate_metadata({"row_count": 1}, schema)  # type: ignore[arg-type]
+        monkeypatch.setattr(validators, "_compile", _fail)
+        assert validate_metadata({"row_count": 5}, schema) == []  # type: ignore[arg-type]
+        assert validate_object_type_metadata({"row_count": -1}, "table")
+
 
 class TestUseCaseCoverage:
     """Verify the schema supports all four primary lineage use cases."""
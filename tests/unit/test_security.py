@@ -6,8 +6,9 @@ import time
 from datetime import timedelta
 
 import pytest
-from jose import JWTError
+from jose import JWTError, jwt
 
+from app.core.config import settings
 from app.core.security import (
     API_KEY_PREFIX,
     create_access_token,
@@ -15,6 +16,7 @@ from app.core.security import (
     decode_token,
     generate_api_key,
     hash_api_key,
+    hash_api_key_legacy,
     hash_password,
     validate_offline_folder,
     verify_api_key,
@@ -40,6 +42,15 @@ class TestPasswordHashing:
         h2 = hash_password("abc")
         assert h1 != h2  # bcrypt uses random salt
 
+    def test_default_rounds_from_settings(self):
+        hashed = hash_password("abc")
+        assert hashed.split("$")[2] == f"{settings.BCRYPT_ROUNDS:02d}"
+
+    def test_explicit_rounds_override(self):
+        hashed = hash_password("abc", rounds=4)
+        assert hashed.split("$")[2] == "04"
+        assert verify_password("abc", hashed)
+
 
 class TestJwt:
     def test_access_token_round_trip(self):
@@ -73,6 +84,25 @@ class TestJwt:
         with pytest.raises(JWTError):
             decode_token(tampered)
 
+    def test_missing_sub_raises(self):
+        token = jwt.encode(
+            {"type": "access", "exp": time.time() + 60}, settings.SECRET_KEY, algorithm="HS256"
+        )
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+    def test_missing_type_raises(self):
+        token = jwt.encode(
+            {"sub": "u", "exp": time.time() + 60}, settings.SECRET_KEY, algorithm="HS256"
+        )
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+    def test_missing_exp_raises(self):
+        token = jwt.encode({"sub": "u", "type": "access"}, settings.SECRET_KEY, algorithm="HS256")
+        with pytest.raises(JWTError):
+            decode_token(token)
+
     def test_refresh_token_not_usable_as_access(self):
         """Callers must check the 'type' field — this documents the contract."""
         refresh = create_refresh_token("u")
@@ -103,6 +133,16 @@ class TestApiKeys:
         stored = hash_api_key(key)
         assert not verify_api_key("lng_wrongkey", stored)
 
+    def test_hash_is_blake2b_128(self):
+        assert len(hash_api_key(generate_api_key())) == 32
+
+    def test_verify_legacy_sha256_hash(self):
+        key = generate_api_key()
+        stored = hash_api_key_legacy(key)
+        assert len(stored) == 64
+        assert verify_api_key(key, stored)
+        assert not verify_api_key("lng_wrongkey", stored)
+
 
 class TestValidateOfflineFolder:
     def test_valid_folder_with_required_files(self):